@@ -46,6 +46,9 @@ export function mockComputeAdjacency(args: Record<string, unknown>): MCPToolResu
     success: true,
     data: {
       adjacency,
+      adjacency_by_id: Object.fromEntries(
+        adjacency.map((entry) => [entry.room_id, entry]),
+      ),
       room_count: rooms.length,
       total_adjacencies: Math.max(0, rooms.length - 1),
     },
@@ -13,6 +13,7 @@ from .self_healing import (
     SEMANTIC_ALIASES,
     get_semantic_aliases,
 )
+from .serialization import dump_json
 
 __all__ = [
     "SelfHealingConfig",
@@ -26,4 +27,5 @@ __all__ = [
     "install_import_hook",
     "SEMANTIC_ALIASES",
     "get_semantic_aliases",
+    "dump_json",
 ]
@@ -0,0 +1,34 @@
+"""Response serialization shared by the MCP servers.
+
+Usage:
+    from common.serialization import dump_json
+
+    text = dump_json(response)
+    pretty = dump_json(response, indent=True)
+"""
+
+from __future__ import annotations
+
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # Optional speedup; fall back to stdlib json
+    orjson = None
+
+
+def dump_json(payload: dict[str, Any], indent: bool = False) -> str:
+    """Serialize a response for the MCP transport.
+
+    Uses orjson when installed and the stdlib json module otherwise. Both
+    stringify non-string dict keys. orjson writes compact UTF-8 instead of
+    ASCII escapes, writes NaN and infinity as null rather than bare
+    ``NaN``/``Infinity``, and raises TypeError on integers wider than 64 bits.
+    """
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(payload, option=option).decode()
+    return json.dumps(payload, indent=2 if indent else None)
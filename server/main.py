@@ -127,6 +127,7 @@ from spatial_server.server import (
     TOOLS as SPATIAL_TOOLS,
     _compute_adjacency,
     _find_nearest,
+    _find_nearest_batch,
     _compute_area,
     _check_clearance,
     _analyze_circulation,
@@ -240,6 +241,7 @@ TOOL_HANDLERS: dict[str, Any] = {
     # Spatial tools
     "compute_adjacency": _compute_adjacency,
     "find_nearest": _find_nearest,
+    "find_nearest_batch": _find_nearest_batch,
     "compute_area": _compute_area,
     "check_clearance": _check_clearance,
     "analyze_circulation": _analyze_circulation,
@@ -23,7 +23,9 @@ import csv
 import io
 import json
 import logging
+import sys
 from datetime import datetime, timezone
+from pathlib import Path
 from typing import Any
 from uuid import uuid4
 
@@ -32,6 +34,13 @@ from mcp.server.stdio import stdio_server
 from mcp.types import Tool, TextContent
 from pydantic import BaseModel, Field, ValidationError
 
+# Add common utilities to path
+_common_path = Path(__file__).parent.parent.parent.parent / "common"
+if str(_common_path) not in sys.path:
+    sys.path.insert(0, str(_common_path))
+
+from serialization import dump_json
+
 logger = logging.getLogger(__name__)
 
 
@@ -253,6 +262,7 @@ def make_error(code: int, message: str) -> dict[str, Any]:
     }
 
 
+
 # =============================================================================
 # Utility Functions
 # =============================================================================
@@ -1911,14 +1921,14 @@ def create_server() -> Server:
             else:
                 result = make_error(404, f"Unknown tool: {name}")
 
-            return [TextContent(type="text", text=json.dumps(result, indent=2))]
+            return [TextContent(type="text", text=dump_json(result, indent=True))]
 
         except Exception as e:
             logger.exception(f"Error in tool {name}")
             return [
                 TextContent(
                     type="text",
-                    text=json.dumps(make_error(500, str(e))),
+                    text=dump_json(make_error(500, str(e))),
                 )
             ]
 
@@ -6,6 +6,7 @@ enabling AI agents to analyze spatial relationships in building models.
 Tools provided:
 - compute_adjacency - Find rooms sharing walls (adjacent rooms)
 - find_nearest - Find elements within radius of a point
+- find_nearest_batch - Run several find_nearest queries over one element set
 - compute_area - Calculate area of a polygon region
 - check_clearance - Verify clearance requirements around elements
 - analyze_circulation - Analyze paths between rooms
@@ -15,10 +16,13 @@ Usage:
 """
 
 import asyncio
-import json
+import heapq
 import logging
 import math
+import sys
 from datetime import datetime, timezone
+from pathlib import Path
+from types import MappingProxyType
 from typing import Any
 from uuid import uuid4
 
@@ -27,6 +31,13 @@ from mcp.server.stdio import stdio_server
 from mcp.types import Tool, TextContent
 from pydantic import BaseModel, Field, ValidationError
 
+# Add common utilities to path
+_common_path = Path(__file__).parent.parent.parent.parent / "common"
+if str(_common_path) not in sys.path:
+    sys.path.insert(0, str(_common_path))
+
+from serialization import dump_json
+
 logger = logging.getLogger(__name__)
 
 
@@ -60,6 +71,30 @@ class FindNearestParams(BaseModel):
     reasoning: str | None = Field(None, description="AI agent reasoning")
 
 
+class NearestQuery(BaseModel):
+    """A single point/radius query for find_nearest_batch."""
+
+    x: float = Field(..., description="X coordinate in meters")
+    y: float = Field(..., description="Y coordinate in meters")
+    radius: float = Field(..., description="Search radius in meters")
+
+
+class FindNearestBatchParams(BaseModel):
+    """Parameters for find_nearest_batch tool."""
+
+    queries: list[NearestQuery] = Field(
+        ..., description="Points to search around, each with its own radius"
+    )
+    elements: list[dict[str, Any]] = Field(
+        ..., description="List of elements with id, type, and position/bounds"
+    )
+    element_types: list[str] | None = Field(
+        None, description="Filter by element types (e.g., ['wall', 'door'])"
+    )
+    limit: int = Field(10, description="Maximum results to return per query")
+    reasoning: str | None = Field(None, description="AI agent reasoning")
+
+
 class ComputeAreaParams(BaseModel):
     """Parameters for compute_area tool."""
 
@@ -160,6 +195,7 @@ def make_error(code: int, message: str) -> dict[str, Any]:
     }
 
 
+
 # =============================================================================
 # Geometry Utilities
 # =============================================================================
@@ -167,9 +203,7 @@ def make_error(code: int, message: str) -> dict[str, Any]:
 
 def distance_2d(p1: list[float], p2: list[float]) -> float:
     """Calculate 2D Euclidean distance."""
-    dx = p2[0] - p1[0]
-    dy = p2[1] - p1[1]
-    return math.sqrt(dx * dx + dy * dy)
+    return math.hypot(p2[0] - p1[0], p2[1] - p1[1])
 
 
 def polygon_area(vertices: list[list[float]]) -> float:
@@ -178,15 +212,13 @@ def polygon_area(vertices: list[list[float]]) -> float:
     Returns positive area for counter-clockwise vertices,
     negative for clockwise.
     """
-    n = len(vertices)
-    if n < 3:
+    if len(vertices) < 3:
         return 0.0
 
-    area = 0.0
-    for i in range(n):
-        j = (i + 1) % n
-        area += vertices[i][0] * vertices[j][1]
-        area -= vertices[j][0] * vertices[i][1]
+    # Pair each vertex with its successor once instead of indexing modulo n
+    area = sum(
+        a[0] * b[1] - b[0] * a[1] for a, b in zip(vertices, vertices[1:] + vertices[:1])
+    )
 
     return area / 2.0
 
@@ -202,42 +234,38 @@ def polygon_centroid(vertices: list[list[float]]) -> list[float]:
         return [(vertices[0][0] + vertices[1][0]) / 2,
                 (vertices[0][1] + vertices[1][1]) / 2]
 
-    area = polygon_area(vertices)
-    if abs(area) < 1e-10:
-        # Degenerate polygon - use simple average
-        cx = sum(v[0] for v in vertices) / n
-        cy = sum(v[1] for v in vertices) / n
-        return [cx, cy]
-
+    # Accumulate the shoelace area and the area-weighted sums in one pass
+    twice_area = 0.0
     cx = 0.0
     cy = 0.0
-    for i in range(n):
-        j = (i + 1) % n
-        cross = vertices[i][0] * vertices[j][1] - vertices[j][0] * vertices[i][1]
-        cx += (vertices[i][0] + vertices[j][0]) * cross
-        cy += (vertices[i][1] + vertices[j][1]) * cross
+    for a, b in zip(vertices, vertices[1:] + vertices[:1]):
+        cross = a[0] * b[1] - b[0] * a[1]
+        twice_area += cross
+        cx += (a[0] + b[0]) * cross
+        cy += (a[1] + b[1]) * cross
 
-    cx /= 6.0 * area
-    cy /= 6.0 * area
+    if abs(twice_area) < 2e-10:
+        # Degenerate polygon - use simple average
+        return [sum(v[0] for v in vertices) / n, sum(v[1] for v in vertices) / n]
 
-    return [cx, cy]
+    scale = 1.0 / (3.0 * twice_area)
+    return [cx * scale, cy * scale]
 
 
 def point_in_polygon(point: list[float], polygon: list[list[float]]) -> bool:
     """Ray casting algorithm to test if point is inside polygon."""
     x, y = point[0], point[1]
-    n = len(polygon)
     inside = False
 
-    j = n - 1
-    for i in range(n):
-        xi, yi = polygon[i][0], polygon[i][1]
-        xj, yj = polygon[j][0], polygon[j][1]
-
-        if ((yi > y) != (yj > y)) and (x < (xj - xi) * (y - yi) / (yj - yi) + xi):
-            inside = not inside
-
-        j = i
+    # Walk (vertex, predecessor) pairs; only edges straddling the ray's y
+    # need the intersection test
+    for cur, prev in zip(polygon, polygon[-1:] + polygon[:-1]):
+        yi = cur[1]
+        yj = prev[1]
+        if (yi > y) != (yj > y):
+            xi = cur[0]
+            if x < (prev[0] - xi) * (y - yi) / (yj - yi) + xi:
+                inside = not inside
 
     return inside
 
@@ -270,6 +298,45 @@ def point_to_bbox_distance(point: list[float], bbox: dict[str, Any]) -> float:
     return distance_2d(point, [cx, cy])
 
 
+# =============================================================================
+# Clearance Constants
+# =============================================================================
+
+# Clearance requirements by type, read-only and shared by every call
+CLEARANCE_SPECS = MappingProxyType(
+    {
+        "door_swing": MappingProxyType(
+            {
+                "description": "Door swing clearance",
+                "min_distance": 0.9,  # 900mm standard
+                "check_area": "arc",
+            }
+        ),
+        "wheelchair": MappingProxyType(
+            {
+                "description": "Wheelchair turning radius",
+                "min_distance": 1.5,  # 1500mm turning circle
+                "check_area": "circle",
+            }
+        ),
+        "furniture": MappingProxyType(
+            {
+                "description": "Furniture clearance",
+                "min_distance": 0.6,  # 600mm passage
+                "check_area": "perimeter",
+            }
+        ),
+        "egress": MappingProxyType(
+            {
+                "description": "Egress path clearance",
+                "min_distance": 1.1,  # 1100mm egress width
+                "check_area": "corridor",
+            }
+        ),
+    }
+)
+
+
 # =============================================================================
 # Tool Implementations
 # =============================================================================
@@ -283,36 +350,35 @@ async def _compute_adjacency(args: dict[str, Any]) -> dict[str, Any]:
         return make_error(400, f"Invalid parameters: {e}")
 
     rooms = params.rooms
-    adjacency_matrix: dict[str, list[str]] = {}
+    # Neighbours per room as insertion-ordered sets (dict keys) for O(1) dedup
+    adjacency_matrix: dict[str, dict[str, None]] = {}
 
     # Build wall -> rooms mapping
     wall_to_rooms: dict[str, list[str]] = {}
     for room in rooms:
         room_id = room.get("id", str(uuid4()))
-        boundary_walls = room.get("boundary_wall_ids", [])
+        # Deduplicate the wall list once so a repeated ID can't pair a room
+        # with itself; dict.fromkeys keeps the input order deterministic
+        boundary_walls = dict.fromkeys(room.get("boundary_wall_ids", []))
 
-        adjacency_matrix[room_id] = []
+        adjacency_matrix[room_id] = {}
 
         for wall_id in boundary_walls:
-            if wall_id not in wall_to_rooms:
-                wall_to_rooms[wall_id] = []
-            wall_to_rooms[wall_id].append(room_id)
+            wall_to_rooms.setdefault(wall_id, []).append(room_id)
 
     # Find adjacencies (rooms sharing walls)
-    for wall_id, room_ids in wall_to_rooms.items():
+    for room_ids in wall_to_rooms.values():
         if len(room_ids) == 2:
             # Two rooms share this wall - they are adjacent
-            room_a, room_b = room_ids[0], room_ids[1]
-            if room_b not in adjacency_matrix[room_a]:
-                adjacency_matrix[room_a].append(room_b)
-            if room_a not in adjacency_matrix[room_b]:
-                adjacency_matrix[room_b].append(room_a)
+            room_a, room_b = room_ids
+            adjacency_matrix[room_a][room_b] = None
+            adjacency_matrix[room_b][room_a] = None
 
     # Format results
     adjacency_list = [
         {
             "room_id": room_id,
-            "adjacent_rooms": adjacent,
+            "adjacent_rooms": list(adjacent),
             "adjacent_count": len(adjacent),
         }
         for room_id, adjacent in adjacency_matrix.items()
@@ -321,6 +387,8 @@ async def _compute_adjacency(args: dict[str, Any]) -> dict[str, Any]:
     return make_response(
         {
             "adjacency": adjacency_list,
+            # Same entries keyed by room ID for O(1) lookup by consumers
+            "adjacency_by_id": {entry["room_id"]: entry for entry in adjacency_list},
             "room_count": len(rooms),
             "total_adjacencies": sum(len(adj) for adj in adjacency_matrix.values()) // 2,
         },
@@ -328,65 +396,147 @@ async def _compute_adjacency(args: dict[str, Any]) -> dict[str, Any]:
     )
 
 
-async def _find_nearest(args: dict[str, Any]) -> dict[str, Any]:
-    """Find elements nearest to a point within radius."""
-    try:
-        params = FindNearestParams(**args)
-    except ValidationError as e:
-        return make_error(400, f"Invalid parameters: {e}")
+def _nearest_targets(
+    elements: list[dict[str, Any]],
+    element_types: list[str] | None,
+) -> list[tuple[dict[str, Any], tuple[float, float, float, float]]]:
+    """Resolve searchable elements to 2D boxes once for any number of queries.
 
-    search_point = [params.x, params.y]
-    results: list[dict[str, Any]] = []
+    Points (position, bbox position, wall midpoint) become zero-size boxes,
+    so every target is measured with the same clamp-to-box distance.
+    Elements filtered out by type or without usable geometry are dropped.
+    """
+    targets: list[tuple[dict[str, Any], tuple[float, float, float, float]]] = []
 
-    for element in params.elements:
+    for element in elements:
         # Filter by type if specified
-        if params.element_types:
+        if element_types:
             etype = element.get("type", element.get("element_type", ""))
-            if etype not in params.element_types:
+            if etype not in element_types:
                 continue
 
-        # Calculate distance
         if "position" in element:
             pos = element["position"]
-            dist = distance_2d(search_point, [pos[0], pos[1]])
+            box = (pos[0], pos[1], pos[0], pos[1])
         elif "bbox" in element:
-            dist = point_to_bbox_distance(search_point, element["bbox"])
+            bbox = element["bbox"]
+            if "min" in bbox and "max" in bbox:
+                box = (bbox["min"][0], bbox["min"][1], bbox["max"][0], bbox["max"][1])
+            elif "position" in bbox:
+                pos = bbox["position"]
+                box = (pos[0], pos[1], pos[0], pos[1])
+            else:
+                continue
         elif "start" in element and "end" in element:
             # Line element (wall) - distance to midpoint
-            mid = [
-                (element["start"][0] + element["end"][0]) / 2,
-                (element["start"][1] + element["end"][1]) / 2,
-            ]
-            dist = distance_2d(search_point, mid)
+            mx = (element["start"][0] + element["end"][0]) / 2
+            my = (element["start"][1] + element["end"][1]) / 2
+            box = (mx, my, mx, my)
         else:
             continue
 
-        # Check if within radius
-        if dist <= params.radius:
-            results.append({
+        targets.append((element, box))
+
+    return targets
+
+
+def _search_nearest(
+    targets: list[tuple[dict[str, Any], tuple[float, float, float, float]]],
+    x: float,
+    y: float,
+    radius: float,
+    limit: int,
+) -> list[dict[str, Any]]:
+    """Return up to ``limit`` targets within ``radius`` of (x, y), nearest first."""
+    if radius < 0:
+        return []
+    sqrt = math.sqrt
+    radius_sq = radius * radius
+    hits: list[tuple[float, int]] = []
+
+    # Filter on squared distance; the root is only taken for hits
+    for index, (_, (x0, y0, x1, y1)) in enumerate(targets):
+        dx = max(x0 - x, x - x1, 0.0)
+        dy = max(y0 - y, y - y1, 0.0)
+        dist_sq = dx * dx + dy * dy
+        if dist_sq <= radius_sq:
+            hits.append((round(sqrt(dist_sq), 4), index))
+
+    # Partial selection of the k nearest; ties on the reported (rounded)
+    # distance fall back to the index, which keeps input order. Result dicts
+    # are only built for the hits that survive.
+    results = []
+    for dist, index in heapq.nsmallest(limit, hits):
+        element = targets[index][0]
+        results.append(
+            {
                 "element_id": element.get("id", "unknown"),
-                "element_type": element.get("type", element.get("element_type", "unknown")),
-                "distance": round(dist, 4),
+                "element_type": element.get(
+                    "type", element.get("element_type", "unknown")
+                ),
+                "distance": dist,
                 "element": element,
-            })
+            }
+        )
+    return results
+
 
-    # Sort by distance
-    results.sort(key=lambda x: x["distance"])
+async def _find_nearest(args: dict[str, Any]) -> dict[str, Any]:
+    """Find elements nearest to a point within radius."""
+    try:
+        params = FindNearestParams(**args)
+    except ValidationError as e:
+        return make_error(400, f"Invalid parameters: {e}")
 
-    # Limit results
-    results = results[: params.limit]
+    targets = _nearest_targets(params.elements, params.element_types)
+    results = _search_nearest(targets, params.x, params.y, params.radius, params.limit)
 
     return make_response(
         {
             "results": results,
             "count": len(results),
-            "search_point": search_point,
+            "search_point": [params.x, params.y],
             "search_radius": params.radius,
         },
         reasoning=params.reasoning,
     )
 
 
+async def _find_nearest_batch(args: dict[str, Any]) -> dict[str, Any]:
+    """Run several nearest-element queries against one element set.
+
+    Element geometry is resolved once and shared by every query, instead of
+    being re-parsed by a separate find_nearest call per point.
+    """
+    try:
+        params = FindNearestBatchParams(**args)
+    except ValidationError as e:
+        return make_error(400, f"Invalid parameters: {e}")
+
+    targets = _nearest_targets(params.elements, params.element_types)
+
+    query_results = []
+    for query in params.queries:
+        results = _search_nearest(targets, query.x, query.y, query.radius, params.limit)
+        query_results.append(
+            {
+                "results": results,
+                "count": len(results),
+                "search_point": [query.x, query.y],
+                "search_radius": query.radius,
+            }
+        )
+
+    return make_response(
+        {
+            "queries": query_results,
+            "query_count": len(query_results),
+            "elements_indexed": len(targets),
+        },
+        reasoning=params.reasoning,
+    )
+
+
 async def _compute_area(args: dict[str, Any]) -> dict[str, Any]:
     """Compute area of a polygon region."""
     try:
@@ -394,14 +544,12 @@ async def _compute_area(args: dict[str, Any]) -> dict[str, Any]:
     except ValidationError as e:
         return make_error(400, f"Invalid parameters: {e}")
 
-    # Calculate main polygon area
-    gross_area = abs(polygon_area(params.polygon))
+    # Shoelace every ring in one pass: outer boundary first, then holes
+    rings = [params.polygon, *(params.include_holes or [])]
+    areas = [abs(polygon_area(ring)) for ring in rings]
 
-    # Subtract holes if any
-    hole_area = 0.0
-    if params.include_holes:
-        for hole in params.include_holes:
-            hole_area += abs(polygon_area(hole))
+    gross_area = areas[0]
+    hole_area = math.fsum(areas[1:])
 
     net_area = gross_area - hole_area
     centroid = polygon_centroid(params.polygon)
@@ -437,52 +585,33 @@ async def _check_clearance(args: dict[str, Any]) -> dict[str, Any]:
     elif "bbox" in element:
         element_center = bbox_center(element["bbox"])
 
-    # Define clearance requirements based on type
-    clearance_specs = {
-        "door_swing": {
-            "description": "Door swing clearance",
-            "min_distance": 0.9,  # 900mm standard
-            "check_area": "arc",
-        },
-        "wheelchair": {
-            "description": "Wheelchair turning radius",
-            "min_distance": 1.5,  # 1500mm turning circle
-            "check_area": "circle",
-        },
-        "furniture": {
-            "description": "Furniture clearance",
-            "min_distance": 0.6,  # 600mm passage
-            "check_area": "perimeter",
-        },
-        "egress": {
-            "description": "Egress path clearance",
-            "min_distance": 1.1,  # 1100mm egress width
-            "check_area": "corridor",
-        },
-    }
-
-    spec = clearance_specs.get(clearance_type, clearance_specs["furniture"])
+    # Look up clearance requirements for this type
+    spec = CLEARANCE_SPECS.get(clearance_type, CLEARANCE_SPECS["furniture"])
     required_clearance = max(min_clearance, spec["min_distance"])
 
     # Check each obstacle
+    ex, ey = element_center[0], element_center[1]
+    hypot = math.hypot
     violations: list[dict[str, Any]] = []
     for obstacle in params.obstacles:
         if "position" in obstacle:
-            obs_pos = obstacle["position"][:2]
-            dist = distance_2d(element_center, obs_pos)
+            obs_pos = obstacle["position"]
+            dist = hypot(obs_pos[0] - ex, obs_pos[1] - ey)
         elif "bbox" in obstacle:
             dist = point_to_bbox_distance(element_center, obstacle["bbox"])
         else:
             continue
 
         if dist < required_clearance:
-            violations.append({
-                "obstacle_id": obstacle.get("id", "unknown"),
-                "obstacle_type": obstacle.get("type", "unknown"),
-                "distance": round(dist, 4),
-                "required": required_clearance,
-                "shortage": round(required_clearance - dist, 4),
-            })
+            violations.append(
+                {
+                    "obstacle_id": obstacle.get("id", "unknown"),
+                    "obstacle_type": obstacle.get("type", "unknown"),
+                    "distance": round(dist, 4),
+                    "required": required_clearance,
+                    "shortage": round(required_clearance - dist, 4),
+                }
+            )
 
     passed = len(violations) == 0
 
@@ -645,7 +774,7 @@ class TopologyGraphPy:
         """Check if two points are within merge tolerance."""
         dx = p2[0] - p1[0]
         dy = p2[1] - p1[1]
-        return math.sqrt(dx * dx + dy * dy) <= self.tolerance
+        return dx * dx + dy * dy <= self.tolerance * self.tolerance
 
     def find_or_create_node(self, position: list[float]) -> str:
         """Find an existing node near position or create a new one."""
@@ -968,7 +1097,7 @@ TOOLS = [
         name="compute_adjacency",
         description="Find adjacent rooms (rooms that share walls). "
         "Input: list of room objects with boundary_wall_ids. "
-        "Output: adjacency matrix showing which rooms are connected.",
+        "Output: adjacency list plus adjacency_by_id keyed by room ID.",
         inputSchema={
             "type": "object",
             "properties": {
@@ -1022,6 +1151,56 @@ TOOLS = [
             "required": ["x", "y", "radius", "elements"],
         },
     ),
+    Tool(
+        name="find_nearest_batch",
+        description="Run several find_nearest queries against one element set. "
+        "Element geometry is resolved once and shared by all queries. "
+        "Returns one sorted result list per query, in query order.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "queries": {
+                    "type": "array",
+                    "items": {
+                        "type": "object",
+                        "properties": {
+                            "x": {
+                                "type": "number",
+                                "description": "X coordinate in meters",
+                            },
+                            "y": {
+                                "type": "number",
+                                "description": "Y coordinate in meters",
+                            },
+                            "radius": {
+                                "type": "number",
+                                "description": "Search radius in meters",
+                            },
+                        },
+                        "required": ["x", "y", "radius"],
+                    },
+                    "description": "Points to search around",
+                },
+                "elements": {
+                    "type": "array",
+                    "items": {"type": "object"},
+                    "description": "Elements to search (with id, type, position/bbox)",
+                },
+                "element_types": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": "Filter by types (e.g., ['wall', 'door'])",
+                },
+                "limit": {
+                    "type": "integer",
+                    "default": 10,
+                    "description": "Max results per query",
+                },
+                "reasoning": {"type": "string"},
+            },
+            "required": ["queries", "elements"],
+        },
+    ),
     Tool(
         name="compute_area",
         description="Calculate area of a polygon region using the shoelace formula. "
@@ -1228,6 +1407,8 @@ def create_server() -> Server:
                 result = await _compute_adjacency(arguments)
             elif name == "find_nearest":
                 result = await _find_nearest(arguments)
+            elif name == "find_nearest_batch":
+                result = await _find_nearest_batch(arguments)
             elif name == "compute_area":
                 result = await _compute_area(arguments)
             elif name == "check_clearance":
@@ -1241,14 +1422,14 @@ def create_server() -> Server:
             else:
                 result = make_error(404, f"Unknown tool: {name}")
 
-            return [TextContent(type="text", text=json.dumps(result, indent=2))]
+            return [TextContent(type="text", text=dump_json(result, indent=True))]
 
         except Exception as e:
             logger.exception(f"Error in tool {name}")
             return [
                 TextContent(
                     type="text",
-                    text=json.dumps(make_error(500, str(e))),
+                    text=dump_json(make_error(500, str(e))),
                 )
             ]
 
@@ -16,6 +16,7 @@ import math
 from spatial_server.server import (
     _compute_adjacency,
     _find_nearest,
+    _find_nearest_batch,
     _compute_area,
     _check_clearance,
     _analyze_circulation,
@@ -26,6 +27,7 @@ from spatial_server.server import (
     point_in_polygon,
     distance_2d,
     TopologyGraphPy,
+    CLEARANCE_SPECS,
 )
 
 
@@ -66,6 +68,16 @@ class TestGeometryUtilities:
         assert abs(centroid[0] - 2.0) < 1e-6
         assert abs(centroid[1] - 2.0) < 1e-6
 
+    def test_polygon_centroid_triangle_and_degenerate(self):
+        """Test centroid for a clockwise triangle and a collinear polygon."""
+        triangle_cw = [[0, 0], [0, 3], [6, 0]]
+        centroid = polygon_centroid(triangle_cw)
+        assert abs(centroid[0] - 2.0) < 1e-9
+        assert abs(centroid[1] - 1.0) < 1e-9
+
+        collinear = [[0, 0], [1, 1], [2, 2]]
+        assert polygon_centroid(collinear) == [1.0, 1.0]
+
     def test_point_in_polygon_inside(self):
         """Test point inside polygon."""
         square = [[0, 0], [10, 0], [10, 10], [0, 10]]
@@ -81,6 +93,14 @@ class TestGeometryUtilities:
         assert point_in_polygon([5, -1], square) is False
         assert point_in_polygon([5, 11], square) is False
 
+    def test_point_in_polygon_concave(self):
+        """Test point containment in an L-shaped (concave) polygon."""
+        l_shape = [[0, 0], [6, 0], [6, 2], [2, 2], [2, 6], [0, 6]]
+        assert point_in_polygon([1, 5], l_shape) is True
+        assert point_in_polygon([5, 1], l_shape) is True
+        assert point_in_polygon([4, 4], l_shape) is False
+        assert point_in_polygon([1, 1], []) is False
+
 
 class TestComputeAdjacency:
     """Tests for compute_adjacency tool."""
@@ -106,6 +126,11 @@ class TestComputeAdjacency:
         assert "room2" in room1_adj["adjacent_rooms"]
         assert "room1" in room2_adj["adjacent_rooms"]
 
+        # Keyed view carries the same entries
+        by_id = result["data"]["adjacency_by_id"]
+        assert by_id["room1"] == room1_adj
+        assert by_id["room2"]["adjacent_rooms"] == ["room1"]
+
     @pytest.mark.asyncio
     async def test_three_adjacent_rooms(self):
         """Test three rooms with varying adjacencies."""
@@ -131,6 +156,21 @@ class TestComputeAdjacency:
         assert result["success"] is True
         assert result["data"]["total_adjacencies"] == 0
 
+    @pytest.mark.asyncio
+    async def test_repeated_wall_ids(self):
+        """Test that a wall listed twice by one room is not a self-adjacency."""
+        rooms = [
+            {"id": "room1", "boundary_wall_ids": ["w1", "w1", "w2"]},
+            {"id": "room2", "boundary_wall_ids": ["w2", "w3", "w2"]},
+        ]
+        result = await _compute_adjacency({"rooms": rooms})
+
+        assert result["success"] is True
+        assert result["data"]["total_adjacencies"] == 1
+        adj_data = result["data"]["adjacency"]
+        assert adj_data[0]["adjacent_rooms"] == ["room2"]
+        assert adj_data[1]["adjacent_rooms"] == ["room1"]
+
 
 class TestFindNearest:
     """Tests for find_nearest tool."""
@@ -192,6 +232,78 @@ class TestFindNearest:
         assert result["success"] is True
         assert result["data"]["count"] == 0
 
+    @pytest.mark.asyncio
+    async def test_find_nearest_batch(self):
+        """Test several queries against one element set."""
+        elements = [
+            {"id": "p1", "type": "column", "position": [0, 0, 0]},
+            {"id": "b1", "type": "door", "bbox": {"min": [4, -1, 0], "max": [6, 1, 2]}},
+            {"id": "w1", "type": "wall", "start": [10, 0], "end": [10, 4]},
+            {"id": "x1", "type": "wall"},  # No geometry - not indexed
+        ]
+        result = await _find_nearest_batch(
+            {
+                "queries": [
+                    {"x": 0, "y": 0, "radius": 5},
+                    {"x": 5, "y": 3, "radius": 2.5},
+                    {"x": 50, "y": 50, "radius": 1},
+                ],
+                "elements": elements,
+            }
+        )
+
+        assert result["success"] is True
+        data = result["data"]
+        assert data["query_count"] == 3
+        assert data["elements_indexed"] == 3
+
+        first, second, third = data["queries"]
+        assert [r["element_id"] for r in first["results"]] == ["p1", "b1"]
+        assert first["results"][1]["distance"] == 4.0  # To the bbox edge
+        assert [r["element_id"] for r in second["results"]] == ["b1"]
+        assert second["results"][0]["distance"] == 2.0
+        assert third["count"] == 0
+
+    @pytest.mark.asyncio
+    async def test_negative_radius_finds_nothing(self):
+        """Test a negative radius is not squared into a positive one."""
+        elements = [{"id": "p1", "type": "column", "position": [0.5, 0, 0]}]
+        single = await _find_nearest(
+            {"x": 0, "y": 0, "radius": -1, "elements": elements}
+        )
+        batch = await _find_nearest_batch(
+            {"queries": [{"x": 0, "y": 0, "radius": -1}], "elements": elements}
+        )
+        assert single["data"]["count"] == 0
+        assert batch["data"]["queries"][0]["count"] == 0
+
+    @pytest.mark.asyncio
+    async def test_find_nearest_matches_batch(self):
+        """Test single-query find_nearest agrees with the batch path."""
+        elements = [
+            {"id": f"e{i}", "type": "wall", "position": [i, i % 3, 0]}
+            for i in range(20)
+        ]
+        single = await _find_nearest(
+            {
+                "x": 5,
+                "y": 1,
+                "radius": 4,
+                "elements": elements,
+                "limit": 5,
+            }
+        )
+        batch = await _find_nearest_batch(
+            {
+                "queries": [{"x": 5, "y": 1, "radius": 4}],
+                "elements": elements,
+                "limit": 5,
+            }
+        )
+
+        assert single["data"]["results"] == batch["data"]["queries"][0]["results"]
+        assert single["data"]["count"] == 5
+
 
 class TestComputeArea:
     """Tests for compute_area tool."""
@@ -270,6 +382,47 @@ class TestCheckClearance:
         # Wheelchair needs 1.5m, obstacle is 1m away
         assert result["data"]["passed"] is False
 
+    @pytest.mark.asyncio
+    async def test_mixed_obstacles(self):
+        """Test position, bbox and unlocatable obstacles in one check."""
+        result = await _check_clearance(
+            {
+                "element": {"id": "door1", "position": [5, 5, 0]},
+                "clearance_type": "door_swing",
+                "obstacles": [
+                    {"id": "bbox1", "bbox": {"min": [5.3, 4, 0], "max": [6, 6, 3]}},
+                    {"id": "far1", "position": [9, 9, 0]},
+                    {"id": "ghost"},  # No position or bbox - ignored
+                    {"id": "pos1", "position": [5, 5.6, 0]},
+                ],
+            }
+        )
+
+        assert result["success"] is True
+        violations = result["data"]["violations"]
+        assert [v["obstacle_id"] for v in violations] == ["bbox1", "pos1"]
+        assert abs(violations[0]["distance"] - 0.3) < 1e-6
+        assert abs(violations[1]["shortage"] - 0.3) < 1e-6
+
+    @pytest.mark.asyncio
+    async def test_clearance_specs_are_read_only(self):
+        """Test the shared clearance table can't be mutated between calls."""
+        with pytest.raises(TypeError):
+            CLEARANCE_SPECS["egress"]["min_distance"] = 0.0
+
+        result = await _check_clearance(
+            {
+                "element": {"id": "door1", "position": [0, 0, 0]},
+                "clearance_type": "unknown",
+                "min_clearance": 0.0,
+                "obstacles": [],
+            }
+        )
+        assert (
+            result["data"]["required_clearance"]
+            == CLEARANCE_SPECS["furniture"]["min_distance"]
+        )
+
 
 class TestAnalyzeCirculation:
     """Tests for analyze_circulation tool."""
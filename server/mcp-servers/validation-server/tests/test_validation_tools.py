@@ -17,7 +17,10 @@ Comprehensive test coverage including:
 """
 
 import pytest
+import json
 import math
+import random
+from itertools import combinations
 
 # Import the internal functions directly for testing
 from validation_server.server import (
@@ -28,16 +31,32 @@ from validation_server.server import (
     _check_door_clearances,
     _check_stair_compliance,
     _detect_clashes,
+    _detect_clashes_between_sets,
+    _ISSUE_TEMPLATES,
+    _make_clash,
+    _make_issue,
+    _OFFLOAD_THRESHOLD,
+    _parse_elements,
+    _validate_general,
+    _validate_geometry,
+    _overlap_pairs,
+    _resolve_boxes,
+    _sweep_axis,
+    _sweep_cross_pairs,
+    _sweep_pairs,
     ValidationIssue,
     ClashResult,
     distance_2d,
     get_element_position,
     get_element_bbox,
     bboxes_intersect,
+    dump_json,
     ADA_REQUIREMENTS,
     FIRE_RATING_DEFAULTS,
     EGRESS_REQUIREMENTS,
     STAIR_REQUIREMENTS_IBC,
+    TOOL_HANDLERS,
+    TOOLS,
 )
 
 
@@ -83,6 +102,14 @@ class TestUtilityFunctions:
         pos = get_element_position(element)
         assert pos is None
 
+    def test_get_element_position_precedence(self):
+        """Test position beats bbox, and an incomplete bbox falls back to start/end."""
+        element = {"position": [1, 2], "bbox": {"min": [0, 0], "max": [10, 10]}}
+        assert get_element_position(element) == [1, 2]
+
+        element = {"bbox": {"position": [3, 3]}, "start": [0, 0], "end": [4, 2]}
+        assert get_element_position(element) == [2.0, 1.0]
+
     def test_get_element_bbox_direct(self):
         """Test bbox extraction from direct bbox field."""
         element = {"bbox": {"min": [0, 0, 0], "max": [10, 10, 3]}}
@@ -122,6 +149,20 @@ class TestUtilityFunctions:
         bbox = get_element_bbox(element)
         assert bbox is None
 
+    def test_resolve_boxes_matches_get_element_bbox(self):
+        """Test flat boxes agree with get_element_bbox and skip bbox-less elements."""
+        elements = [
+            {"bbox": {"min": [0, 0, 0], "max": [1, 2, 3]}},
+            {"start": [0, 0], "end": [4, 0], "thickness": 0.2, "base_level": 1.0},
+            {"id": "no-geometry"},
+            {"position": [5, 5], "width": 1.0},
+        ]
+        valid, boxes = _resolve_boxes(elements)
+        assert valid == [elements[0], elements[1], elements[3]]
+        for element, box in zip(valid, boxes):
+            bbox = get_element_bbox(element)
+            assert list(box) == pytest.approx(bbox["min"] + bbox["max"])
+
     def test_bboxes_intersect_true(self):
         """Test overlapping bounding boxes."""
         bbox_a = {"min": [0, 0, 0], "max": [5, 5, 5]}
@@ -156,6 +197,49 @@ class TestUtilityFunctions:
         assert intersects is True
         assert severity in ("soft", "hard")
 
+    def test_bboxes_intersect_clearance_uses_largest_gap(self):
+        """Test boxes separated on two axes are judged by the larger gap."""
+        bbox_a = {"min": [0, 0, 0], "max": [5, 5, 5]}
+        near = {"min": [5.5, 0, 0], "max": [10, 5, 5]}
+        diagonal = {"min": [5.5, 7, 0], "max": [10, 10, 5]}  # 2m gap in Y
+
+        intersects, severity, gap = bboxes_intersect(bbox_a, near, clearance=1.0)
+        assert (intersects, severity) == (True, "clearance")
+        assert abs(gap - 0.5) < 1e-9
+
+        intersects, severity, gap = bboxes_intersect(bbox_a, diagonal, clearance=1.0)
+        assert (intersects, severity, gap) == (False, "none", 0.0)
+
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    def test_dump_json_round_trip(self, use_orjson, monkeypatch):
+        """Test response serialization with and without orjson."""
+        import serialization
+
+        if use_orjson and serialization.orjson is None:
+            pytest.skip("orjson not installed")
+        if not use_orjson:
+            monkeypatch.setattr(serialization, "orjson", None)
+
+        payload = {"success": True, "data": {"area": "12.5m²", "counts": {"error": 0}}}
+        assert json.loads(dump_json(payload)) == payload
+        assert json.loads(dump_json(payload, indent=True)) == payload
+        assert "\n" in dump_json(payload, indent=True)
+
+    def test_dump_json_orjson_edge_cases(self):
+        """Test the documented orjson output differences."""
+        import serialization
+
+        if serialization.orjson is None:
+            pytest.skip("orjson not installed")
+
+        assert json.loads(dump_json({1: "a"})) == {"1": "a"}
+        assert json.loads(dump_json({"gap": math.nan, "area": math.inf})) == {
+            "gap": None,
+            "area": None,
+        }
+        with pytest.raises(TypeError):
+            dump_json({"id": 2**64})
+
 
 class TestValidationIssue:
     """Tests for ValidationIssue class."""
@@ -188,6 +272,42 @@ class TestValidationIssue:
         assert d["code"] == "TEST001"
         assert d["severity"] == "warning"
 
+    def test_validation_issue_ids_unique_and_stable(self):
+        """Test issue IDs are unique per issue and fixed once assigned."""
+        issues = [
+            ValidationIssue(
+                code="TEST001", message="m", severity="info", category="test"
+            )
+            for _ in range(3)
+        ]
+        ids = [issue.id for issue in issues]
+        assert len(set(ids)) == 3
+        assert issues[0].id == ids[0]
+        assert issues[0].to_dict()["id"] == ids[0]
+
+    def test_make_issue_uses_template(self):
+        """Test issues built from a code take its severity, category and fix."""
+        issue = _make_issue("DOOR002", "Door d1 is cramped", element_id="d1")
+        assert (issue["severity"], issue["category"]) == ("error", "accessibility")
+        assert issue["suggested_fix"] == "Increase clear floor space in front of door"
+
+        issue = _make_issue(
+            "DOOR002", "Door d1 is cramped", suggested_fix="Move the wall"
+        )
+        assert issue["suggested_fix"] == "Move the wall"
+
+    def test_issue_templates_use_known_severities(self):
+        """Test every template severity can be ranked for threshold filtering."""
+        for severity, _, _ in _ISSUE_TEMPLATES.values():
+            assert severity in ("info", "warning", "error")
+
+    def test_validation_issue_has_no_instance_dict(self):
+        """Test issues use slots rather than a per-instance __dict__."""
+        issue = ValidationIssue(
+            code="TEST001", message="m", severity="info", category="test"
+        )
+        assert not hasattr(issue, "__dict__")
+
 
 class TestClashResult:
     """Tests for ClashResult class."""
@@ -224,6 +344,24 @@ class TestClashResult:
         assert d["element_a_id"] == "a"
         assert d["penetration_depth"] == 0.05
 
+    def test_clash_ids_unique(self):
+        """Test clash IDs stay unique without a uuid per clash."""
+        clashes = [
+            ClashResult("a", "b", "wall", "wall", "hard", "error", 0.1)
+            for _ in range(100)
+        ]
+        assert len({c.to_dict()["id"] for c in clashes}) == 100
+
+    def test_make_clash_matches_to_dict_shape(self):
+        """Test clash dicts built by the tools match ClashResult.to_dict()."""
+        args = ("a", "b", "wall", "column", "hard", "error", 0.123456, [1, 2, 3])
+        built = _make_clash(*args)
+        expected = ClashResult(*args).to_dict()
+        assert built.keys() == expected.keys()
+        assert {k: v for k, v in built.items() if k != "id"} == {
+            k: v for k, v in expected.items() if k != "id"
+        }
+
 
 # =============================================================================
 # Clash Detection Tests
@@ -297,6 +435,128 @@ class TestDetectClashes:
         assert result["success"] is True
         assert result["data"]["clash_count"] >= 0  # May or may not detect as hard
 
+    @pytest.mark.asyncio
+    async def test_severity_threshold_drops_lower_clash_types(self):
+        """Test each threshold keeps only clash types at or above it."""
+        elements = [
+            {"id": "a", "type": "wall", "bbox": {"min": [0, 0, 0], "max": [1, 1, 1]}},
+            {
+                "id": "b",
+                "type": "wall",
+                "bbox": {"min": [0.5, 0, 0], "max": [1.5, 1, 1]},
+            },  # hard with a
+            {
+                "id": "c",
+                "type": "wall",
+                "bbox": {"min": [1.5, 0, 0], "max": [2, 1, 1]},
+            },  # touches b
+            {
+                "id": "d",
+                "type": "wall",
+                "bbox": {"min": [2.2, 0, 0], "max": [3, 1, 1]},
+            },  # near c
+        ]
+        found = {}
+        for threshold in ("clearance", "soft", "hard"):
+            result = await _detect_clashes(
+                {
+                    "elements": elements,
+                    "severity_threshold": threshold,
+                    "clearance_distance": 0.5,
+                }
+            )
+            found[threshold] = sorted(
+                c["clash_type"] for c in result["data"]["clashes"]
+            )
+        assert found == {
+            "clearance": ["clearance", "clearance", "hard", "soft"],
+            "soft": ["hard", "soft"],
+            "hard": ["hard"],
+        }
+
+    @pytest.mark.asyncio
+    async def test_limit_caps_listed_clashes_only(self):
+        """Test limit trims the clash list but not the counts."""
+        elements = [
+            {
+                "id": f"col{i}",
+                "type": "column",
+                "bbox": {"min": [i * 0.5, 0, 0], "max": [i * 0.5 + 1, 1, 3]},
+            }
+            for i in range(6)
+        ]
+        full = await _detect_clashes({"elements": elements})
+        limited = await _detect_clashes({"elements": elements, "limit": 2})
+        assert full["data"]["clash_count"] > 2
+        assert full["data"]["clashes_truncated"] is False
+        assert len(limited["data"]["clashes"]) == 2
+        assert limited["data"]["clashes_truncated"] is True
+        assert limited["data"]["clash_count"] == full["data"]["clash_count"]
+        assert limited["data"]["counts"] == full["data"]["counts"]
+
+    @pytest.mark.asyncio
+    async def test_negative_limit_rejected(self):
+        """Test a negative limit is a parameter error."""
+        elements = [
+            {
+                "id": "col1",
+                "type": "column",
+                "bbox": {"min": [0, 0, 0], "max": [1, 1, 3]},
+            },
+        ]
+        result = await _detect_clashes({"elements": elements, "limit": -1})
+        assert result["success"] is False
+        assert result["error"]["code"] == 400
+
+    @pytest.mark.asyncio
+    async def test_overlap_with_clearance_is_hard(self):
+        """Test a real overlap stays hard and negative clearance is rejected."""
+        elements = [
+            {"id": "a", "type": "wall", "bbox": {"min": [0, 0, 0], "max": [2, 2, 3]}},
+            {"id": "b", "type": "beam", "bbox": {"min": [1, 1, 1], "max": [3, 3, 2]}},
+        ]
+        result = await _detect_clashes(
+            {
+                "elements": elements,
+                "clearance_distance": 2.0,
+                "severity_threshold": "clearance",
+            }
+        )
+        assert result["data"]["clash_count"] == 1
+        assert result["data"]["clashes"][0]["clash_type"] == "hard"
+
+        result = await _detect_clashes(
+            {"elements": elements, "clearance_distance": -2.0}
+        )
+        assert result["success"] is False
+        assert result["error"]["code"] == 400
+
+    @pytest.mark.asyncio
+    async def test_clearance_ignored_when_clearance_clashes_filtered(self):
+        """Test clearance distance doesn't change soft-threshold results."""
+        rng = random.Random(9)
+        elements = []
+        for i in range(100):
+            x, y = rng.uniform(0, 40), rng.uniform(0, 40)
+            elements.append(
+                {
+                    "id": f"e{i}",
+                    "type": "wall",
+                    "bbox": {"min": [x, y, 0], "max": [x + 2, y + 2, 3]},
+                }
+            )
+
+        def summary(result):
+            return [
+                (c["element_a_id"], c["element_b_id"], c["clash_type"])
+                for c in result["data"]["clashes"]
+            ]
+
+        plain = await _detect_clashes({"elements": elements})
+        wide = await _detect_clashes({"elements": elements, "clearance_distance": 3.0})
+        assert summary(plain)
+        assert summary(wide) == summary(plain)
+
     @pytest.mark.asyncio
     async def test_element_type_filter(self):
         """Test filtering clashes by element type."""
@@ -347,6 +607,22 @@ class TestDetectClashes:
         # Only 1 element has bbox, so only 1 checked
         assert result["data"]["elements_checked"] == 1
 
+    @pytest.mark.asyncio
+    async def test_elements_without_ids(self):
+        """Test that elements lacking IDs are still checked by position."""
+        elements = [
+            {"type": "wall", "bbox": {"min": [0, 0, 0], "max": [5, 1, 3]}},
+            {"type": "wall", "bbox": {"min": [4, 0, 0], "max": [9, 1, 3]}},
+        ]
+        result = await _detect_clashes({"elements": elements})
+        assert result["success"] is True
+        assert result["data"]["clash_count"] == 1
+        clash = result["data"]["clashes"][0]
+        assert (clash["element_a_id"], clash["element_b_id"]) == (
+            "element_0",
+            "element_1",
+        )
+
     @pytest.mark.asyncio
     async def test_clash_location(self):
         """Test that clash location is calculated correctly."""
@@ -376,6 +652,85 @@ class TestDetectClashes:
         assert result["data"]["clash_count"] == 0
         assert result["data"]["elements_checked"] == 50
 
+    def test_sweep_matches_all_pairs(self):
+        """Test the sweep broad phase finds exactly the all-pairs clashes."""
+        rng = random.Random(7)
+        boxes = []
+        for _ in range(120):
+            x, y, z = rng.uniform(0, 40), rng.uniform(0, 40), rng.uniform(0, 3)
+            boxes.append((x, y, z, x + rng.uniform(0, 3), y + rng.uniform(0, 3), z + 1))
+
+        tolerance, clearance = 0.01, 0.5
+        expected = _overlap_pairs(
+            boxes, combinations(range(len(boxes)), 2), tolerance, clearance
+        )
+        swept = _overlap_pairs(
+            boxes, _sweep_pairs(boxes, tolerance + clearance), tolerance, clearance
+        )
+        assert expected
+        assert swept == expected
+
+    def test_sweep_picks_cheapest_axis(self):
+        """Test a tower of stacked floors is swept along Z."""
+        rng = random.Random(3)
+        boxes = []
+        for floor in range(20):
+            z = floor * 3.0
+            for _ in range(10):
+                x, y = rng.uniform(0, 10), rng.uniform(0, 10)
+                boxes.append((x, y, z, x + 1, y + 1, z + 2.7))
+
+        assert _sweep_axis(boxes) == 2
+        # Walls running along X in a single-storey plan are swept along Y
+        walls = [(x, x % 7, 0, x + 5, x % 7 + 0.2, 3) for x in range(0, 50, 2)]
+        assert _sweep_axis(walls) == 1
+        expected = _overlap_pairs(boxes, combinations(range(len(boxes)), 2), 0.0, 0.0)
+        swept = _overlap_pairs(boxes, _sweep_pairs(boxes, 0.0), 0.0, 0.0)
+        assert swept == expected
+
+    def test_cross_sweep_matches_all_cross_pairs(self):
+        """Test the set-vs-set sweep finds exactly the cross-set clashes."""
+        rng = random.Random(11)
+        boxes = []
+        for _ in range(150):
+            x, y, z = rng.uniform(0, 30), rng.uniform(0, 30), rng.uniform(0, 3)
+            boxes.append((x, y, z, x + rng.uniform(0, 4), y + rng.uniform(0, 4), z + 1))
+        split = 60
+
+        tolerance, clearance = 0.01, 0.3
+        all_cross = ((i, j) for i in range(split) for j in range(split, len(boxes)))
+        expected = _overlap_pairs(boxes, all_cross, tolerance, clearance)
+        candidates = _sweep_cross_pairs(boxes, split, tolerance + clearance)
+        assert all(i < split <= j for i, j in candidates)
+        assert expected
+        assert _overlap_pairs(boxes, candidates, tolerance, clearance) == expected
+
+    @pytest.mark.asyncio
+    async def test_many_elements_with_clashes(self):
+        """Test clashes are still found once the broad phase kicks in."""
+        elements = [
+            {
+                "id": f"elem{i}",
+                "type": "column",
+                "bbox": {"min": [i * 10, 0, 0], "max": [i * 10 + 1, 1, 3]},
+            }
+            for i in range(100)
+        ]
+        elements.append(
+            {
+                "id": "beam",
+                "type": "beam",
+                "bbox": {"min": [495.5, 0.2, 1], "max": [510.5, 0.8, 1.5]},
+            }
+        )
+        result = await _detect_clashes({"elements": elements})
+        assert result["success"] is True
+        assert {c["element_a_id"] for c in result["data"]["clashes"]} == {
+            "elem50",
+            "elem51",
+        }
+        assert result["data"]["pairs_checked"] == 101 * 100 // 2
+
 
 # =============================================================================
 # Fire Compliance Tests
@@ -441,6 +796,21 @@ class TestCheckFireCompliance:
         assert result["success"] is True
         assert result["data"]["passed"] is False
 
+    @pytest.mark.asyncio
+    async def test_fire_requirement_overrides_do_not_leak(self):
+        """Test an override applies only to the call that passes it."""
+        elements = [{"id": "c1", "type": "corridor", "fire_rating": 1.0}]
+        result = await _check_fire_compliance(
+            {
+                "elements": elements,
+                "fire_rating_requirements": {"corridor": 2.0},
+            }
+        )
+        assert result["data"]["passed"] is False
+
+        result = await _check_fire_compliance({"elements": elements})
+        assert result["data"]["passed"] is True
+
 
 # =============================================================================
 # Accessibility Tests
@@ -561,19 +931,20 @@ class TestCheckEgress:
         assert any(i["code"] == "EGRESS011" for i in result["data"]["issues"])
 
     @pytest.mark.asyncio
-    async def test_different_occupancy_types(self):
+    @pytest.mark.parametrize(
+        "occupancy",
+        ["assembly", "business", "educational", "factory", "residential", "storage"],
+    )
+    async def test_different_occupancy_types(self, occupancy):
         """Test different occupancy type requirements."""
         rooms = [{"id": "room1", "area": 100, "exit_door_ids": ["d1", "d2"]}]
         doors = [{"id": "d1", "width": 0.9}, {"id": "d2", "width": 0.9}]
 
-        for occupancy in ["assembly", "business", "educational", "factory", "residential", "storage"]:
-            result = await _check_egress({
-                "rooms": rooms,
-                "doors": doors,
-                "occupancy_type": occupancy
-            })
-            assert result["success"] is True
-            assert result["data"]["occupancy_type"] == occupancy
+        result = await _check_egress(
+            {"rooms": rooms, "doors": doors, "occupancy_type": occupancy}
+        )
+        assert result["success"] is True
+        assert result["data"]["occupancy_type"] == occupancy
 
     @pytest.mark.asyncio
     async def test_empty_rooms(self):
@@ -622,6 +993,22 @@ class TestCheckDoorClearances:
         assert result["success"] is True
         assert any(i["code"] == "DOOR002" for i in result["data"]["issues"])
 
+    @pytest.mark.asyncio
+    async def test_door_failing_both_checks_shares_location(self):
+        """Test both door issues carry the same position."""
+        doors = [
+            {
+                "id": "door1",
+                "width": 0.7,
+                "clear_floor_space": 1.2,
+                "position": [3, 4, 0],
+            }
+        ]
+        result = await _check_door_clearances({"doors": doors})
+        issues = result["data"]["issues"]
+        assert [i["code"] for i in issues] == ["DOOR001", "DOOR002"]
+        assert all(i["location"] == [3, 4] for i in issues)
+
     @pytest.mark.asyncio
     async def test_custom_clearance_requirements(self):
         """Test custom clearance requirements."""
@@ -746,6 +1133,17 @@ class TestValidateModel:
         assert result["success"] is True
         assert any(i["code"] == "GEOM002" for i in result["data"]["issues"])
 
+    @pytest.mark.asyncio
+    async def test_zero_length_wall_element_type_field(self):
+        """Test walls typed via element_type are checked, and a null ID is still an ID."""
+        elements = [
+            {"id": None, "element_type": "wall", "start": [1, 1], "end": [1, 1]},
+        ]
+        result = await _validate_model({"elements": elements})
+        codes = [i["code"] for i in result["data"]["issues"]]
+        assert "GEOM001" in codes
+        assert "GEN001" not in codes
+
     @pytest.mark.asyncio
     async def test_invalid_width(self):
         """Test detection of invalid width."""
@@ -787,6 +1185,23 @@ class TestValidateModel:
         assert result["success"] is True
         assert any(i["code"] == "GEN002" for i in result["data"]["issues"])
 
+    @pytest.mark.asyncio
+    async def test_duplicate_id_reported_once(self):
+        """Test an ID used three times yields a single GEN002 issue."""
+        elements = [
+            {"id": "wall1", "type": "wall", "start": [0, 0], "end": [5, 0]},
+            {"id": "wall1", "type": "wall", "start": [5, 0], "end": [10, 0]},
+            {"id": "wall2", "type": "wall", "start": [10, 0], "end": [15, 0]},
+            {"id": "wall1", "type": "wall", "start": [15, 0], "end": [20, 0]},
+        ]
+        result = await _validate_model(
+            {"elements": elements, "categories": ["general"]}
+        )
+        dups = [i for i in result["data"]["issues"] if i["code"] == "GEN002"]
+        assert len(dups) == 1
+        assert dups[0]["element_id"] == "wall1"
+        assert "3 elements" in dups[0]["message"]
+
     @pytest.mark.asyncio
     async def test_category_filter(self):
         """Test filtering by validation category."""
@@ -820,6 +1235,59 @@ class TestValidateModel:
         assert result["success"] is True
         assert all(i["severity"] == "error" for i in result["data"]["issues"])
 
+    def test_rules_skip_warnings_below_threshold(self):
+        """Test rules don't build warning issues when only errors are wanted."""
+        elements = _parse_elements(
+            [
+                {"type": "wall", "start": [0, 0], "end": [0.05, 0]},
+                {"id": "w2", "type": "wall", "start": [0, 0], "end": [0, 0]},
+            ]
+        )
+        error_rank = 2
+        assert [i["code"] for i in _validate_geometry(elements)] == [
+            "GEOM002",
+            "GEOM001",
+        ]
+        assert [i["code"] for i in _validate_geometry(elements, error_rank)] == [
+            "GEOM001"
+        ]
+        assert [i["code"] for i in _validate_general(elements)] == ["GEN001"]
+        assert _validate_general(elements, error_rank) == []
+
+    def test_parse_elements_full_and_partial_records(self):
+        """Test complete and partial element dicts parse to the same fields."""
+        full, partial, untyped = _parse_elements(
+            [
+                {
+                    "id": "w1",
+                    "type": "wall",
+                    "start": [0, 0],
+                    "end": [1, 0],
+                    "width": 0.2,
+                    "height": 3,
+                },
+                {"id": "d1", "type": "door", "width": 0.9},
+                {
+                    "id": "w2",
+                    "type": None,
+                    "element_type": "wall",
+                    "start": [0, 0],
+                    "end": [1, 0],
+                    "width": 0.2,
+                    "height": 3,
+                },
+            ]
+        )
+        assert (full.has_id, full.type, full.end, full.height) == (
+            True,
+            "wall",
+            [1, 0],
+            3,
+        )
+        assert (partial.type, partial.start, partial.width) == ("door", None, 0.9)
+        # An explicit null type is kept, as the clash tools resolve it
+        assert untyped.type is None
+
     @pytest.mark.asyncio
     async def test_all_categories(self):
         """Test running all validation categories."""
@@ -830,6 +1298,42 @@ class TestValidateModel:
         for cat in expected_categories:
             assert cat in result["data"]["categories_checked"]
 
+    @pytest.mark.asyncio
+    async def test_categories_run_in_fixed_order(self):
+        """Test selected categories run in rule order and unknown ones are ignored."""
+        result = await _validate_model(
+            {
+                "elements": [],
+                "categories": ["general", "unknown", "egress"],
+            }
+        )
+        assert result["data"]["categories_checked"] == ["egress", "general"]
+
+    @pytest.mark.asyncio
+    async def test_fire_safety_room_checks(self):
+        """Test compartment issues come before exit issues, with fallback fields."""
+        rooms = [
+            {"id": "hall", "area": 600, "type": "assembly", "exit_count": 2},
+            {"id": "store", "area": 150, "door_count": 1},
+            {"id": "atrium", "area": 700, "function": "lobby"},
+        ]
+        result = await _validate_model(
+            {
+                "elements": [],
+                "rooms": rooms,
+                "categories": ["fire_safety"],
+            }
+        )
+        issues = result["data"]["issues"]
+        assert [(i["code"], i["element_id"]) for i in issues] == [
+            ("FIRE001", "hall"),
+            ("FIRE001", "atrium"),
+            ("FIRE002", "store"),
+            ("FIRE002", "atrium"),
+        ]
+        assert "(assembly)" in issues[0]["message"]
+        assert "(lobby)" in issues[1]["message"]
+
 
 # =============================================================================
 # Validation Error Handling Tests
@@ -880,6 +1384,51 @@ class TestPerformance:
         assert result["success"] is True
         assert result["data"]["element_count"] == 100
 
+    @pytest.mark.asyncio
+    async def test_large_model_validated_off_loop(self):
+        """Test models past the offload threshold give the same issues."""
+        elements = [
+            {
+                "id": f"wall{i}",
+                "type": "wall",
+                "start": [i * 5, 0],
+                "end": [i * 5 + 4, 0],
+            }
+            for i in range(_OFFLOAD_THRESHOLD)
+        ]
+        elements.append({"id": "wall0", "type": "wall", "start": [0, 0], "end": [0, 0]})
+        result = await _validate_model({"elements": elements})
+        assert result["success"] is True
+        assert [i["code"] for i in result["data"]["issues"]] == ["GEOM001", "GEN002"]
+        assert result["data"]["categories_checked"][0] == "geometry"
+
+    @pytest.mark.asyncio
+    async def test_large_set_clashes_checked_off_loop(self):
+        """Test set-vs-set checks past the offload threshold find the same clashes."""
+        half = _OFFLOAD_THRESHOLD // 2
+        set_a = [
+            {
+                "id": f"beam{i}",
+                "type": "beam",
+                "bbox": {"min": [i * 5, 0, 0], "max": [i * 5 + 1, 1, 1]},
+            }
+            for i in range(half)
+        ]
+        set_b = [
+            {
+                "id": f"duct{i}",
+                "type": "duct",
+                "bbox": {"min": [i * 5 + 3, 0, 0], "max": [i * 5 + 4, 1, 1]},
+            }
+            for i in range(half)
+        ]
+        set_b[7]["bbox"] = {"min": [35.5, 0.2, 0.2], "max": [36.5, 0.8, 0.8]}
+        result = await _detect_clashes_between_sets({"set_a": set_a, "set_b": set_b})
+        assert result["success"] is True
+        assert [
+            (c["element_a_id"], c["element_b_id"]) for c in result["data"]["clashes"]
+        ] == [("beam7", "duct7")]
+
     @pytest.mark.asyncio
     async def test_large_clash_detection(self):
         """Test clash detection with many elements."""
@@ -940,3 +1489,14 @@ class TestConstants:
         assert "min_width" in STAIR_REQUIREMENTS_IBC
         assert "max_riser_height" in STAIR_REQUIREMENTS_IBC
         assert "min_tread_depth" in STAIR_REQUIREMENTS_IBC
+
+    def test_every_tool_has_a_handler(self):
+        """Test call_tool's dispatch table covers exactly the listed tools."""
+        assert set(TOOL_HANDLERS) == {tool.name for tool in TOOLS}
+
+    def test_constants_are_read_only(self):
+        """Test that compliance tables cannot be mutated at runtime."""
+        with pytest.raises(TypeError):
+            ADA_REQUIREMENTS["door_clear_width"] = 0.5
+        with pytest.raises(TypeError):
+            EGRESS_REQUIREMENTS["business"]["min_exits"] = 1
@@ -16,10 +16,18 @@ Usage:
 """
 
 import asyncio
-import json
 import logging
 import math
+import sys
+from collections import Counter
+from collections.abc import Awaitable, Callable, Iterable
+from dataclasses import dataclass
 from datetime import datetime, timezone
+from functools import lru_cache
+from itertools import combinations, count
+from operator import itemgetter
+from pathlib import Path
+from types import MappingProxyType
 from typing import Any
 from uuid import uuid4
 
@@ -28,6 +36,13 @@ from mcp.server.stdio import stdio_server
 from mcp.types import Tool, TextContent
 from pydantic import BaseModel, Field, ValidationError
 
+# Add common utilities to path
+_common_path = Path(__file__).parent.parent.parent.parent / "common"
+if str(_common_path) not in sys.path:
+    sys.path.insert(0, str(_common_path))
+
+from serialization import dump_json
+
 logger = logging.getLogger(__name__)
 
 
@@ -153,7 +168,12 @@ class DetectClashesParams(BaseModel):
         None, description="Optional batch size for pair checks"
     )
     clearance_distance: float = Field(
-        0.0, description="Clearance distance for soft clash detection (meters)"
+        0.0, ge=0, description="Clearance distance for soft clash detection (meters)"
+    )
+    limit: int | None = Field(
+        None,
+        ge=0,
+        description="Maximum clashes to list; counts still cover all clashes",
     )
     reasoning: str | None = Field(None, description="AI agent reasoning")
 
@@ -171,19 +191,50 @@ class DetectClashesBetweenSetsParams(BaseModel):
         0.001, description="Tolerance for clash detection in meters"
     )
     clearance_distance: float = Field(
-        0.0, description="Clearance distance for soft clash detection"
+        0.0, ge=0, description="Clearance distance for soft clash detection"
     )
     reasoning: str | None = Field(None, description="AI agent reasoning")
 
 
+# Validators pinned at import; handlers validate raw args with these directly
+# instead of going through BaseModel.__init__
+_VALIDATE_MODEL_VALIDATOR = ValidateModelParams.__pydantic_validator__
+_CHECK_FIRE_COMPLIANCE_VALIDATOR = CheckFireComplianceParams.__pydantic_validator__
+_CHECK_ACCESSIBILITY_VALIDATOR = CheckAccessibilityParams.__pydantic_validator__
+_CHECK_EGRESS_VALIDATOR = CheckEgressParams.__pydantic_validator__
+_CHECK_DOOR_CLEARANCES_VALIDATOR = CheckDoorClearancesParams.__pydantic_validator__
+_CHECK_STAIR_COMPLIANCE_VALIDATOR = CheckStairComplianceParams.__pydantic_validator__
+_DETECT_CLASHES_VALIDATOR = DetectClashesParams.__pydantic_validator__
+_DETECT_CLASHES_BETWEEN_SETS_VALIDATOR = (
+    DetectClashesBetweenSetsParams.__pydantic_validator__
+)
+
+
 # =============================================================================
 # Validation Issue Types
 # =============================================================================
 
 
+# Issue and clash IDs are a per-process random prefix plus a sequence number,
+# so building a result doesn't pay for a uuid4() each time
+_ISSUE_ID_PREFIX = uuid4().hex[:12]
+_issue_counter = count(1)
+
+
 class ValidationIssue:
     """A validation issue found in the model."""
 
+    __slots__ = (
+        "_id",
+        "category",
+        "code",
+        "element_id",
+        "location",
+        "message",
+        "severity",
+        "suggested_fix",
+    )
+
     def __init__(
         self,
         code: str,
@@ -194,7 +245,7 @@ class ValidationIssue:
         location: list[float] | None = None,
         suggested_fix: str | None = None,
     ):
-        self.id = str(uuid4())
+        self._id: str | None = None
         self.code = code
         self.message = message
         self.severity = severity  # error, warning, info
@@ -203,6 +254,13 @@ class ValidationIssue:
         self.location = location
         self.suggested_fix = suggested_fix
 
+    @property
+    def id(self) -> str:
+        """Issue ID, assigned on first access."""
+        if self._id is None:
+            self._id = f"{_ISSUE_ID_PREFIX}-{next(_issue_counter)}"
+        return self._id
+
     def to_dict(self) -> dict[str, Any]:
         return {
             "id": self.id,
@@ -216,11 +274,148 @@ class ValidationIssue:
         }
 
 
+@dataclass(frozen=True, slots=True)
+class _ModelElement:
+    """Element fields read by the validate_model rules, extracted once."""
+
+    has_id: bool
+    id: Any
+    type: Any
+    start: list[float] | None
+    end: list[float] | None
+    width: float | None
+    height: float | None
+
+
+# Fast path for elements that carry every rule field
+_ELEMENT_FIELDS = itemgetter("id", "type", "start", "end", "width", "height")
+
+
+def _parse_elements(elements: list[dict[str, Any]]) -> list[_ModelElement]:
+    """Pull the rule-relevant fields out of each element dict in one pass."""
+    parsed = []
+    fields = _ELEMENT_FIELDS
+    for element in elements:
+        try:
+            eid, etype, start, end, width, height = fields(element)
+        except KeyError:
+            pass
+        else:
+            parsed.append(
+                _ModelElement(
+                    has_id=True,
+                    id=eid,
+                    type=etype,
+                    start=start,
+                    end=end,
+                    width=width,
+                    height=height,
+                )
+            )
+            continue
+        get = element.get
+        if "type" in element:
+            etype = element["type"]
+        else:
+            etype = get("element_type", "unknown")
+        parsed.append(
+            _ModelElement(
+                has_id="id" in element,
+                id=get("id"),
+                type=etype,
+                start=get("start"),
+                end=get("end"),
+                width=get("width"),
+                height=get("height"),
+            )
+        )
+    return parsed
+
+
+# Rank of issue severities for severity_threshold filtering
+_ISSUE_SEVERITY_ORDER = MappingProxyType({"info": 0, "warning": 1, "error": 2})
+_WARNING_RANK = _ISSUE_SEVERITY_ORDER["warning"]
+
+# Static fields of each issue code: (severity, category, suggested_fix).
+# Call sites only supply what varies per issue.
+_ISSUE_TEMPLATES = MappingProxyType(
+    {
+        "GEOM001": ("error", "geometry", "Remove or extend the wall to a valid length"),
+        "GEOM002": ("warning", "geometry", None),
+        "GEOM003": ("error", "geometry", None),
+        "GEOM004": ("error", "geometry", None),
+        "ADA001": ("error", "accessibility", None),
+        "ADA002": ("warning", "accessibility", None),
+        "ACCESS001": ("error", "accessibility", None),
+        "ACCESS002": ("error", "accessibility", "Lower or remove threshold"),
+        "ACCESS003": ("error", "accessibility", None),
+        "ACCESS004": ("warning", "accessibility", None),
+        "DOOR001": ("error", "accessibility", None),
+        "DOOR002": (
+            "error",
+            "accessibility",
+            "Increase clear floor space in front of door",
+        ),
+        "FIRE001": (
+            "warning",
+            "fire_safety",
+            "Consider subdividing with fire-rated partitions",
+        ),
+        "FIRE002": ("warning", "fire_safety", "Add additional exit doors"),
+        "FIRE010": ("error", "fire_safety", None),
+        "FIRE011": ("error", "fire_safety", None),
+        "EGRESS001": ("error", "egress", None),
+        "EGRESS002": ("warning", "egress", None),
+        "EGRESS010": ("error", "egress", "Add closer exit or reduce room depth"),
+        "EGRESS011": ("error", "egress", None),
+        "EGRESS012": ("error", "egress", None),
+        "STAIR001": ("error", "egress", None),
+        "STAIR002": ("error", "egress", None),
+        "STAIR003": ("error", "egress", None),
+        "STAIR004": ("error", "egress", None),
+        "STAIR005": ("error", "egress", None),
+        "GEN001": ("warning", "general", None),
+        "GEN002": ("error", "general", None),
+    }
+)
+
+
+def _make_issue(
+    code: str,
+    message: str,
+    element_id: str | None = None,
+    location: list[float] | None = None,
+    suggested_fix: str | None = None,
+) -> dict[str, Any]:
+    """Build an issue dict from its code's template.
+
+    The dict has the same shape as ``ValidationIssue.to_dict()`` and goes
+    straight into the response, so rules never construct the class.
+    A ``suggested_fix`` passed here overrides the template's.
+    """
+    severity, category, default_fix = _ISSUE_TEMPLATES[code]
+    return {
+        "id": f"{_ISSUE_ID_PREFIX}-{next(_issue_counter)}",
+        "code": code,
+        "message": message,
+        "severity": severity,
+        "category": category,
+        "element_id": element_id,
+        "location": location,
+        "suggested_fix": suggested_fix or default_fix,
+    }
+
+
 # =============================================================================
 # Response Helpers
 # =============================================================================
 
 
+# Pre-bound for the response envelope timestamp, built on every tool call
+_utcnow = datetime.now
+_UTC = timezone.utc
+
+
 def make_response(
     data: dict[str, Any],
     reasoning: str | None = None,
@@ -229,7 +424,7 @@ def make_response(
     return {
         "success": True,
         "data": data,
-        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "timestamp": _utcnow(_UTC).isoformat(),
         "audit": {"reasoning": reasoning},
     }
 
@@ -239,16 +434,20 @@ def make_error(code: int, message: str) -> dict[str, Any]:
     return {
         "success": False,
         "error": {"code": code, "message": message},
-        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "timestamp": _utcnow(_UTC).isoformat(),
     }
 
 
+
 # =============================================================================
 # Compliance Constants
 # =============================================================================
 
+# Tables are exposed as read-only MappingProxyType views; tools pre-bind the
+# values they need to locals before entering their per-element loops.
+
 # ADA Accessibility Requirements
-ADA_REQUIREMENTS = {
+ADA_REQUIREMENTS = MappingProxyType({
     "door_clear_width": 0.815,  # 32 inches minimum
     "door_maneuvering_clearance": 1.525,  # 60 inches for wheelchair
     "corridor_width": 0.915,  # 36 inches minimum
@@ -256,29 +455,43 @@ ADA_REQUIREMENTS = {
     "turning_radius": 1.525,  # 60 inches diameter
     "threshold_height": 0.0125,  # 1/2 inch max
     "door_opening_force": 22.2,  # 5 lbf max (22.2 N)
-}
+})
 
 # Fire Rating Requirements (hours)
-FIRE_RATING_DEFAULTS = {
+FIRE_RATING_DEFAULTS = MappingProxyType({
     "exit_stair_enclosure": 2.0,
     "exit_passageway": 1.0,
     "corridor": 1.0,
     "shaft_enclosure": 2.0,
     "occupancy_separation": 2.0,
-}
+})
 
 # Egress Requirements by Occupancy
-EGRESS_REQUIREMENTS = {
-    "assembly": {"max_travel": 61.0, "min_exits": 2, "occupant_factor": 0.65},
-    "business": {"max_travel": 61.0, "min_exits": 2, "occupant_factor": 9.3},
-    "educational": {"max_travel": 61.0, "min_exits": 2, "occupant_factor": 1.86},
-    "factory": {"max_travel": 76.0, "min_exits": 2, "occupant_factor": 9.3},
-    "residential": {"max_travel": 61.0, "min_exits": 2, "occupant_factor": 18.6},
-    "storage": {"max_travel": 122.0, "min_exits": 2, "occupant_factor": 46.5},
-}
+EGRESS_REQUIREMENTS = MappingProxyType(
+    {
+        "assembly": MappingProxyType(
+            {"max_travel": 61.0, "min_exits": 2, "occupant_factor": 0.65}
+        ),
+        "business": MappingProxyType(
+            {"max_travel": 61.0, "min_exits": 2, "occupant_factor": 9.3}
+        ),
+        "educational": MappingProxyType(
+            {"max_travel": 61.0, "min_exits": 2, "occupant_factor": 1.86}
+        ),
+        "factory": MappingProxyType(
+            {"max_travel": 76.0, "min_exits": 2, "occupant_factor": 9.3}
+        ),
+        "residential": MappingProxyType(
+            {"max_travel": 61.0, "min_exits": 2, "occupant_factor": 18.6}
+        ),
+        "storage": MappingProxyType(
+            {"max_travel": 122.0, "min_exits": 2, "occupant_factor": 46.5}
+        ),
+    }
+)
 
 # Stair Requirements (IBC)
-STAIR_REQUIREMENTS_IBC = {
+STAIR_REQUIREMENTS_IBC = MappingProxyType({
     "min_width": 1.118,  # 44 inches
     "min_headroom": 2.032,  # 80 inches (6'8")
     "max_riser_height": 0.178,  # 7 inches
@@ -287,7 +500,7 @@ STAIR_REQUIREMENTS_IBC = {
     "max_riser_variation": 0.0095,  # 3/8 inch
     "handrail_height_min": 0.864,  # 34 inches
     "handrail_height_max": 0.965,  # 38 inches
-}
+})
 
 
 # =============================================================================
@@ -297,9 +510,7 @@ STAIR_REQUIREMENTS_IBC = {
 
 def distance_2d(p1: list[float], p2: list[float]) -> float:
     """Calculate 2D Euclidean distance."""
-    dx = p2[0] - p1[0]
-    dy = p2[1] - p1[1]
-    return math.sqrt(dx * dx + dy * dy)
+    return math.hypot(p2[0] - p1[0], p2[1] - p1[1])
 
 
 def get_element_position(element: dict[str, Any]) -> list[float] | None:
@@ -329,60 +540,40 @@ def get_element_position(element: dict[str, Any]) -> list[float] | None:
 async def _validate_model(args: dict[str, Any]) -> dict[str, Any]:
     """Run all validation rules against the model."""
     try:
-        params = ValidateModelParams(**args)
+        params = _VALIDATE_MODEL_VALIDATOR.validate_python(args)
     except ValidationError as e:
         return make_error(400, f"Invalid parameters: {e}")
 
-    issues: list[ValidationIssue] = []
-    categories_run: list[str] = []
-
-    # Determine which categories to run
-    all_categories = ["geometry", "accessibility", "fire_safety", "egress", "general"]
-    run_categories = params.categories or all_categories
-
-    # Geometry validation
-    if "geometry" in run_categories:
-        categories_run.append("geometry")
-        issues.extend(_validate_geometry(params.elements))
-
-    # Accessibility validation
-    if "accessibility" in run_categories:
-        categories_run.append("accessibility")
-        issues.extend(_validate_accessibility_basic(params.doors, params.rooms))
-
-    # Fire safety validation
-    if "fire_safety" in run_categories:
-        categories_run.append("fire_safety")
-        issues.extend(_validate_fire_safety_basic(params.elements, params.rooms))
-
-    # Egress validation
-    if "egress" in run_categories:
-        categories_run.append("egress")
-        issues.extend(_validate_egress_basic(params.rooms, params.doors))
+    # Large models are checked on a worker thread so the server's event loop
+    # keeps serving other requests meanwhile
+    severity_order = _ISSUE_SEVERITY_ORDER
+    threshold = severity_order.get(params.severity_threshold, 1)
 
-    # General model validation
-    if "general" in run_categories:
-        categories_run.append("general")
-        issues.extend(_validate_general(params.elements))
+    model_size = len(params.elements) + len(params.doors) + len(params.rooms)
+    if model_size >= _OFFLOAD_THRESHOLD:
+        categories_run, issues = await asyncio.to_thread(
+            _run_model_rules, params, threshold
+        )
+    else:
+        categories_run, issues = _run_model_rules(params, threshold)
 
     # Filter by severity threshold
-    severity_order = {"info": 0, "warning": 1, "error": 2}
-    threshold = severity_order.get(params.severity_threshold, 1)
     filtered_issues = [
-        i for i in issues if severity_order.get(i.severity, 0) >= threshold
+        i for i in issues if severity_order.get(i["severity"], 0) >= threshold
     ]
 
-    # Count by severity
+    # Count by severity in a single pass
+    tally = Counter(i["severity"] for i in filtered_issues)
     counts = {
-        "error": sum(1 for i in filtered_issues if i.severity == "error"),
-        "warning": sum(1 for i in filtered_issues if i.severity == "warning"),
-        "info": sum(1 for i in filtered_issues if i.severity == "info"),
+        "error": tally["error"],
+        "warning": tally["warning"],
+        "info": tally["info"],
     }
 
     return make_response(
         {
             "valid": counts["error"] == 0,
-            "issues": [i.to_dict() for i in filtered_issues],
+            "issues": filtered_issues,
             "issue_count": len(filtered_issues),
             "counts": counts,
             "categories_checked": categories_run,
@@ -392,61 +583,70 @@ async def _validate_model(args: dict[str, Any]) -> dict[str, Any]:
     )
 
 
-def _validate_geometry(elements: list[dict[str, Any]]) -> list[ValidationIssue]:
+# Squared wall-length thresholds: near-zero (1mm) and very short (0.1m)
+_ZERO_LENGTH_SQ = 0.001**2
+_SHORT_LENGTH_SQ = 0.1**2
+
+
+def _validate_geometry(
+    elements: list[_ModelElement], min_rank: int = 0
+) -> list[dict[str, Any]]:
     """Validate geometry correctness."""
     issues = []
+    append = issues.append
+    sqrt = math.sqrt
+    report_warnings = min_rank <= _WARNING_RANK
 
     for element in elements:
-        eid = element.get("id", "unknown")
-        etype = element.get("type", element.get("element_type", "unknown"))
+        eid = element.id if element.has_id else "unknown"
 
         # Check for zero-length walls
-        if etype == "wall":
-            if "start" in element and "end" in element:
-                length = distance_2d(element["start"], element["end"])
-                if length < 0.001:
-                    issues.append(
-                        ValidationIssue(
-                            code="GEOM001",
-                            message=f"Wall {eid} has near-zero length ({length:.4f}m)",
-                            severity="error",
-                            category="geometry",
+        if element.type == "wall":
+            start = element.start
+            end = element.end
+            if start is not None and end is not None:
+                # Compare squared lengths; the root is only taken for messages
+                dx = end[0] - start[0]
+                dy = end[1] - start[1]
+                length_sq = dx * dx + dy * dy
+                if length_sq < _ZERO_LENGTH_SQ:
+                    length = sqrt(length_sq)
+                    append(
+                        _make_issue(
+                            "GEOM001",
+                            f"Wall {eid} has near-zero length ({length:.4f}m)",
                             element_id=eid,
-                            location=element.get("start"),
-                            suggested_fix="Remove or extend the wall to a valid length",
+                            location=start,
                         )
                     )
-                elif length < 0.1:
-                    issues.append(
-                        ValidationIssue(
-                            code="GEOM002",
-                            message=f"Wall {eid} is very short ({length:.2f}m)",
-                            severity="warning",
-                            category="geometry",
+                elif length_sq < _SHORT_LENGTH_SQ and report_warnings:
+                    length = sqrt(length_sq)
+                    append(
+                        _make_issue(
+                            "GEOM002",
+                            f"Wall {eid} is very short ({length:.2f}m)",
                             element_id=eid,
-                            location=element.get("start"),
+                            location=start,
                         )
                     )
 
         # Check for invalid dimensions
-        if "width" in element and element["width"] <= 0:
-            issues.append(
-                ValidationIssue(
-                    code="GEOM003",
-                    message=f"Element {eid} has invalid width: {element['width']}",
-                    severity="error",
-                    category="geometry",
+        width = element.width
+        if width is not None and width <= 0:
+            append(
+                _make_issue(
+                    "GEOM003",
+                    f"Element {eid} has invalid width: {width}",
                     element_id=eid,
                 )
             )
 
-        if "height" in element and element["height"] <= 0:
-            issues.append(
-                ValidationIssue(
-                    code="GEOM004",
-                    message=f"Element {eid} has invalid height: {element['height']}",
-                    severity="error",
-                    category="geometry",
+        height = element.height
+        if height is not None and height <= 0:
+            append(
+                _make_issue(
+                    "GEOM004",
+                    f"Element {eid} has invalid height: {height}",
                     element_id=eid,
                 )
             )
@@ -455,30 +655,32 @@ def _validate_geometry(elements: list[dict[str, Any]]) -> list[ValidationIssue]:
 
 
 def _validate_accessibility_basic(
-    doors: list[dict[str, Any]], rooms: list[dict[str, Any]]
-) -> list[ValidationIssue]:
+    doors: list[dict[str, Any]], rooms: list[dict[str, Any]], min_rank: int = 0
+) -> list[dict[str, Any]]:
     """Basic accessibility validation."""
     issues = []
+    min_door_width = ADA_REQUIREMENTS["door_clear_width"]
 
     for door in doors:
         did = door.get("id", "unknown")
         width = door.get("width", 0.9)
 
         # Check door clear width
-        if width < ADA_REQUIREMENTS["door_clear_width"]:
+        if width < min_door_width:
             issues.append(
-                ValidationIssue(
-                    code="ADA001",
-                    message=f"Door {did} width ({width:.3f}m) is below ADA minimum ({ADA_REQUIREMENTS['door_clear_width']:.3f}m)",
-                    severity="error",
-                    category="accessibility",
+                _make_issue(
+                    "ADA001",
+                    f"Door {did} width ({width:.3f}m) is below ADA minimum ({min_door_width:.3f}m)",
                     element_id=did,
                     location=get_element_position(door),
-                    suggested_fix=f"Increase door width to at least {ADA_REQUIREMENTS['door_clear_width']:.3f}m",
+                    suggested_fix=f"Increase door width to at least {min_door_width:.3f}m",
                 )
             )
 
-    # Check room sizes for wheelchair access
+    # Check room sizes for wheelchair access (warnings only)
+    if min_rank > _WARNING_RANK:
+        return issues
+
     for room in rooms:
         rid = room.get("id", "unknown")
         area = room.get("area", 0)
@@ -487,11 +689,9 @@ def _validate_accessibility_basic(
         min_area = 2.25  # 1.5m x 1.5m
         if area > 0 and area < min_area:
             issues.append(
-                ValidationIssue(
-                    code="ADA002",
-                    message=f"Room {rid} area ({area:.2f}m²) may not accommodate wheelchair turning",
-                    severity="warning",
-                    category="accessibility",
+                _make_issue(
+                    "ADA002",
+                    f"Room {rid} area ({area:.2f}m²) may not accommodate wheelchair turning",
                     element_id=rid,
                 )
             )
@@ -500,100 +700,105 @@ def _validate_accessibility_basic(
 
 
 def _validate_fire_safety_basic(
-    elements: list[dict[str, Any]], rooms: list[dict[str, Any]]
-) -> list[ValidationIssue]:
+    rooms: list[dict[str, Any]], min_rank: int = 0
+) -> list[dict[str, Any]]:
     """Basic fire safety validation."""
-    issues = []
+    # Every basic fire safety issue is a warning
+    if min_rank > _WARNING_RANK:
+        return []
+
+    compartment_issues = []
+    exit_issues = []
 
-    # Check room sizes for fire compartments
+    # One pass over rooms; compartment issues still come before exit issues
     for room in rooms:
-        rid = room.get("id", "unknown")
-        area = room.get("area", 0)
-        room_type = room.get("function", room.get("type", ""))
+        get = room.get
+        rid = get("id", "unknown")
+        area = get("area", 0)
 
         # Check compartment size
         if area > 500:  # Default max compartment
-            issues.append(
-                ValidationIssue(
-                    code="FIRE001",
-                    message=f"Room {rid} ({room_type}) exceeds maximum compartment area ({area:.1f}m² > 500m²)",
-                    severity="warning",
-                    category="fire_safety",
+            room_type = get("function")
+            if room_type is None:
+                room_type = get("type", "")
+            compartment_issues.append(
+                _make_issue(
+                    "FIRE001",
+                    f"Room {rid} ({room_type}) exceeds maximum compartment area ({area:.1f}m² > 500m²)",
                     element_id=rid,
-                    suggested_fix="Consider subdividing with fire-rated partitions",
                 )
             )
 
-    # Check for exit signs/doors in large rooms
-    for room in rooms:
-        rid = room.get("id", "unknown")
-        area = room.get("area", 0)
-        exit_count = room.get("exit_count", room.get("door_count", 0))
-
-        if area > 100 and exit_count < 2:
-            issues.append(
-                ValidationIssue(
-                    code="FIRE002",
-                    message=f"Room {rid} ({area:.1f}m²) should have at least 2 exits",
-                    severity="warning",
-                    category="fire_safety",
-                    element_id=rid,
-                    suggested_fix="Add additional exit doors",
+        # Check for exit signs/doors in large rooms
+        if area > 100:
+            exit_count = get("exit_count")
+            if exit_count is None:
+                exit_count = get("door_count", 0)
+            if exit_count < 2:
+                exit_issues.append(
+                    _make_issue(
+                        "FIRE002",
+                        f"Room {rid} ({area:.1f}m²) should have at least 2 exits",
+                        element_id=rid,
+                    )
                 )
-            )
 
-    return issues
+    return compartment_issues + exit_issues
 
 
 def _validate_egress_basic(
-    rooms: list[dict[str, Any]], doors: list[dict[str, Any]]
-) -> list[ValidationIssue]:
+    rooms: list[dict[str, Any]], doors: list[dict[str, Any]], min_rank: int = 0
+) -> list[dict[str, Any]]:
     """Basic egress validation."""
     issues = []
+    report_warnings = min_rank <= _WARNING_RANK
+
+    # Door widths only feed the exit-width warning
+    door_widths = (
+        {d.get("id"): d.get("width", 0.9) for d in doors} if report_warnings else {}
+    )
 
-    # Build door lookup
-    door_map = {d.get("id"): d for d in doors}
+    default_reqs = EGRESS_REQUIREMENTS["business"]
 
+    # One read of each room field; both checks share them
     for room in rooms:
-        rid = room.get("id", "unknown")
-        exit_door_ids = room.get("exit_door_ids", [])
-        area = room.get("area", 0)
-        occupancy = room.get("occupancy_type", "business")
+        get = room.get
+        rid = get("id", "unknown")
+        exit_door_ids = get("exit_door_ids", [])
+        exit_count = len(exit_door_ids)
+        area = get("area", 0)
+        occupancy = get("occupancy_type", "business")
 
         # Get egress requirements
-        reqs = EGRESS_REQUIREMENTS.get(occupancy, EGRESS_REQUIREMENTS["business"])
+        reqs = EGRESS_REQUIREMENTS.get(occupancy, default_reqs)
+        min_exits = reqs["min_exits"]
 
         # Check number of exits
-        if area > 50 and len(exit_door_ids) < reqs["min_exits"]:
+        if area > 50 and exit_count < min_exits:
             issues.append(
-                ValidationIssue(
-                    code="EGRESS001",
-                    message=f"Room {rid} has {len(exit_door_ids)} exits, requires {reqs['min_exits']} minimum",
-                    severity="error",
-                    category="egress",
+                _make_issue(
+                    "EGRESS001",
+                    f"Room {rid} has {exit_count} exits, requires {min_exits} minimum",
                     element_id=rid,
-                    suggested_fix=f"Add {reqs['min_exits'] - len(exit_door_ids)} more exit(s)",
+                    suggested_fix=f"Add {min_exits - exit_count} more exit(s)",
                 )
             )
 
-        # Check if any exit door width is adequate
-        total_exit_width = 0
-        for door_id in exit_door_ids:
-            if door_id in door_map:
-                total_exit_width += door_map[door_id].get("width", 0.9)
+        # Check if any exit door width is adequate (warning only)
+        if area > 0 and report_warnings:
+            total_exit_width = sum(
+                door_widths.get(door_id, 0) for door_id in exit_door_ids
+            )
 
-        # Estimate occupancy
-        if area > 0:
+            # Estimate occupancy
             est_occupancy = area / reqs["occupant_factor"]
             required_width = est_occupancy * 0.005  # 5mm per occupant (rough)
 
             if total_exit_width < required_width and total_exit_width > 0:
                 issues.append(
-                    ValidationIssue(
-                        code="EGRESS002",
-                        message=f"Room {rid} exit width ({total_exit_width:.2f}m) may be insufficient for estimated occupancy ({est_occupancy:.0f})",
-                        severity="warning",
-                        category="egress",
+                    _make_issue(
+                        "EGRESS002",
+                        f"Room {rid} exit width ({total_exit_width:.2f}m) may be insufficient for estimated occupancy ({est_occupancy:.0f})",
                         element_id=rid,
                     )
                 )
@@ -601,69 +806,138 @@ def _validate_egress_basic(
     return issues
 
 
-def _validate_general(elements: list[dict[str, Any]]) -> list[ValidationIssue]:
+def _validate_general(
+    elements: list[_ModelElement], min_rank: int = 0
+) -> list[dict[str, Any]]:
     """General model validation."""
-    issues = []
-
-    # Check for missing IDs
-    for i, element in enumerate(elements):
-        if "id" not in element:
-            issues.append(
-                ValidationIssue(
-                    code="GEN001",
-                    message=f"Element at index {i} is missing an ID",
-                    severity="warning",
-                    category="general",
-                )
-            )
+    issues: list[dict[str, Any]] = []
+
+    # Check for missing IDs (warnings only)
+    if min_rank <= _WARNING_RANK:
+        issues += [
+            _make_issue("GEN001", f"Element at index {i} is missing an ID")
+            for i, element in enumerate(elements)
+            if not element.has_id
+        ]
 
-    # Check for duplicate IDs
-    ids_seen: dict[str, int] = {}
-    for element in elements:
-        eid = element.get("id")
-        if eid:
-            if eid in ids_seen:
-                issues.append(
-                    ValidationIssue(
-                        code="GEN002",
-                        message=f"Duplicate element ID: {eid}",
-                        severity="error",
-                        category="general",
-                        element_id=eid,
-                    )
-                )
-            ids_seen[eid] = ids_seen.get(eid, 0) + 1
+    # Check for duplicate IDs; one issue per duplicated ID, in first-seen order
+    id_counts = Counter(element.id for element in elements if element.id)
+    issues += [
+        _make_issue(
+            "GEN002",
+            f"Duplicate element ID: {eid} (used by {uses} elements)",
+            element_id=eid,
+        )
+        for eid, uses in id_counts.items()
+        if uses > 1
+    ]
 
     return issues
 
 
+# Models with at least this many elements, doors and rooms combined are
+# validated off the event loop
+_OFFLOAD_THRESHOLD = 2000
+
+
+def _run_model_rules(
+    params: ValidateModelParams, min_rank: int = 0
+) -> tuple[list[str], list[dict[str, Any]]]:
+    """Run the selected validate_model rules.
+
+    Rules skip building issues ranked below ``min_rank`` in
+    ``_ISSUE_SEVERITY_ORDER``.
+
+    Returns:
+        (categories_run, issues)
+    """
+    issues: list[dict[str, Any]] = []
+    categories_run: list[str] = []
+
+    # Determine which categories to run
+    all_categories = ["geometry", "accessibility", "fire_safety", "egress", "general"]
+    run_categories = params.categories or all_categories
+
+    # Only the geometry and general rules read the elements; parse them once
+    elements: list[_ModelElement] = []
+    if "geometry" in run_categories or "general" in run_categories:
+        elements = _parse_elements(params.elements)
+
+    # Geometry validation
+    if "geometry" in run_categories:
+        categories_run.append("geometry")
+        issues.extend(_validate_geometry(elements, min_rank))
+
+    # Accessibility validation
+    if "accessibility" in run_categories:
+        categories_run.append("accessibility")
+        issues.extend(
+            _validate_accessibility_basic(params.doors, params.rooms, min_rank)
+        )
+
+    # Fire safety validation
+    if "fire_safety" in run_categories:
+        categories_run.append("fire_safety")
+        issues.extend(_validate_fire_safety_basic(params.rooms, min_rank))
+
+    # Egress validation
+    if "egress" in run_categories:
+        categories_run.append("egress")
+        issues.extend(_validate_egress_basic(params.rooms, params.doors, min_rank))
+
+    # General model validation
+    if "general" in run_categories:
+        categories_run.append("general")
+        issues.extend(_validate_general(elements, min_rank))
+
+    return categories_run, issues
+
+
+@lru_cache(maxsize=64)
+def _effective_fire_ratings(
+    overrides: tuple[tuple[str, float], ...],
+) -> MappingProxyType:
+    """Fire rating defaults merged with caller overrides.
+
+    Cached on the sorted override items, so the common no-override call and
+    repeated override sets don't rebuild the mapping.
+    """
+    return MappingProxyType({**FIRE_RATING_DEFAULTS, **dict(overrides)})
+
+
 async def _check_fire_compliance(args: dict[str, Any]) -> dict[str, Any]:
     """Detailed fire compliance checking."""
     try:
-        params = CheckFireComplianceParams(**args)
+        params = _CHECK_FIRE_COMPLIANCE_VALIDATOR.validate_python(args)
     except ValidationError as e:
         return make_error(400, f"Invalid parameters: {e}")
 
-    issues: list[ValidationIssue] = []
+    issues: list[dict[str, Any]] = []
 
     # Merge default fire ratings with provided requirements
-    fire_ratings = {**FIRE_RATING_DEFAULTS, **params.fire_rating_requirements}
+    fire_ratings = _effective_fire_ratings(
+        tuple(sorted(params.fire_rating_requirements.items()))
+    )
+
+    required_rating = fire_ratings.get
 
     # Check element fire ratings
     for element in params.elements:
-        eid = element.get("id", "unknown")
-        etype = element.get("type", element.get("element_type", ""))
-        rating = element.get("fire_rating", 0)
+        get = element.get
+        eid = get("id", "unknown")
+        if "type" in element:
+            etype = element["type"]
+        else:
+            etype = get("element_type", "")
+        rating = get("fire_rating", 0)
 
         # Check if type requires fire rating
-        required = fire_ratings.get(etype, 0)
+        required = required_rating(etype, 0)
         if required > 0 and rating < required:
             issues.append(
-                ValidationIssue(
-                    code="FIRE010",
-                    message=f"Element {eid} ({etype}) fire rating ({rating}hr) is below requirement ({required}hr)",
-                    severity="error",
-                    category="fire_safety",
+                _make_issue(
+                    "FIRE010",
+                    f"Element {eid} ({etype}) fire rating ({rating}hr) is below requirement ({required}hr)",
                     element_id=eid,
                     location=get_element_position(element),
                     suggested_fix=f"Upgrade element to {required}hr fire-rated construction",
@@ -677,21 +951,19 @@ async def _check_fire_compliance(args: dict[str, Any]) -> dict[str, Any]:
 
         if area > params.max_compartment_area:
             issues.append(
-                ValidationIssue(
-                    code="FIRE011",
-                    message=f"Room {rid} exceeds compartment limit ({area:.1f}m² > {params.max_compartment_area}m²)",
-                    severity="error",
-                    category="fire_safety",
+                _make_issue(
+                    "FIRE011",
+                    f"Room {rid} exceeds compartment limit ({area:.1f}m² > {params.max_compartment_area}m²)",
                     element_id=rid,
                 )
             )
 
-    passed = not any(i.severity == "error" for i in issues)
+    passed = not any(i["severity"] == "error" for i in issues)
 
     return make_response(
         {
             "passed": passed,
-            "issues": [i.to_dict() for i in issues],
+            "issues": issues,
             "issue_count": len(issues),
             "elements_checked": len(params.elements),
             "rooms_checked": len(params.rooms),
@@ -704,46 +976,57 @@ async def _check_fire_compliance(args: dict[str, Any]) -> dict[str, Any]:
 async def _check_accessibility(args: dict[str, Any]) -> dict[str, Any]:
     """Detailed accessibility compliance checking."""
     try:
-        params = CheckAccessibilityParams(**args)
+        params = _CHECK_ACCESSIBILITY_VALIDATOR.validate_python(args)
     except ValidationError as e:
         return make_error(400, f"Invalid parameters: {e}")
 
-    issues: list[ValidationIssue] = []
+    issues: list[dict[str, Any]] = []
 
     # Get requirements based on standard
     reqs = ADA_REQUIREMENTS  # Default to ADA
+    min_door_width = reqs["door_clear_width"]
+    max_threshold = reqs["threshold_height"]
+    min_corridor_width = reqs["corridor_width"]
+    turning_radius = reqs["turning_radius"]
+    # Threshold text is the same in every message, so format it once per call
+    standard = params.standard
+    min_door_str = f"{min_door_width:.3f}m"
+    max_threshold_str = f"{max_threshold:.4f}m"
+    min_corridor_str = f"{min_corridor_width:.3f}m"
+    turning_radius_str = f"{turning_radius:.3f}m"
 
     # Check doors
     for door in params.doors:
         did = door.get("id", "unknown")
         width = door.get("width", 0.9)
         threshold_height = door.get("threshold_height", 0)
+        too_narrow = width < min_door_width
+        threshold_too_high = threshold_height > max_threshold
+        if not (too_narrow or threshold_too_high):
+            continue
+        # Both issues share one location lookup
+        pos = get_element_position(door)
 
         # Clear width check
-        if width < reqs["door_clear_width"]:
+        if too_narrow:
             issues.append(
-                ValidationIssue(
-                    code="ACCESS001",
-                    message=f"Door {did} clear width ({width:.3f}m) below {params.standard} minimum ({reqs['door_clear_width']:.3f}m)",
-                    severity="error",
-                    category="accessibility",
+                _make_issue(
+                    "ACCESS001",
+                    f"Door {did} clear width ({width:.3f}m) below {standard} minimum ({min_door_str})",
                     element_id=did,
-                    location=get_element_position(door),
-                    suggested_fix=f"Widen door to minimum {reqs['door_clear_width']:.3f}m",
+                    location=pos,
+                    suggested_fix=f"Widen door to minimum {min_door_str}",
                 )
             )
 
         # Threshold height check
-        if threshold_height > reqs["threshold_height"]:
+        if threshold_too_high:
             issues.append(
-                ValidationIssue(
-                    code="ACCESS002",
-                    message=f"Door {did} threshold ({threshold_height:.4f}m) exceeds {params.standard} maximum ({reqs['threshold_height']:.4f}m)",
-                    severity="error",
-                    category="accessibility",
+                _make_issue(
+                    "ACCESS002",
+                    f"Door {did} threshold ({threshold_height:.4f}m) exceeds {standard} maximum ({max_threshold_str})",
                     element_id=did,
-                    location=get_element_position(door),
-                    suggested_fix="Lower or remove threshold",
+                    location=pos,
                 )
             )
 
@@ -752,13 +1035,11 @@ async def _check_accessibility(args: dict[str, Any]) -> dict[str, Any]:
         cid = corridor.get("id", "unknown")
         width = corridor.get("width", 1.2)
 
-        if width < reqs["corridor_width"]:
+        if width < min_corridor_width:
             issues.append(
-                ValidationIssue(
-                    code="ACCESS003",
-                    message=f"Corridor {cid} width ({width:.3f}m) below {params.standard} minimum ({reqs['corridor_width']:.3f}m)",
-                    severity="error",
-                    category="accessibility",
+                _make_issue(
+                    "ACCESS003",
+                    f"Corridor {cid} width ({width:.3f}m) below {standard} minimum ({min_corridor_str})",
                     element_id=cid,
                     location=get_element_position(corridor),
                 )
@@ -769,24 +1050,22 @@ async def _check_accessibility(args: dict[str, Any]) -> dict[str, Any]:
         rid = room.get("id", "unknown")
         min_dimension = room.get("min_dimension", float("inf"))
 
-        if min_dimension < reqs["turning_radius"]:
+        if min_dimension < turning_radius:
             issues.append(
-                ValidationIssue(
-                    code="ACCESS004",
-                    message=f"Room {rid} may lack wheelchair turning space (min dim: {min_dimension:.3f}m, need: {reqs['turning_radius']:.3f}m)",
-                    severity="warning",
-                    category="accessibility",
+                _make_issue(
+                    "ACCESS004",
+                    f"Room {rid} may lack wheelchair turning space (min dim: {min_dimension:.3f}m, need: {turning_radius_str})",
                     element_id=rid,
                 )
             )
 
-    passed = not any(i.severity == "error" for i in issues)
+    passed = not any(i["severity"] == "error" for i in issues)
 
     return make_response(
         {
             "passed": passed,
             "standard": params.standard,
-            "issues": [i.to_dict() for i in issues],
+            "issues": issues,
             "issue_count": len(issues),
             "doors_checked": len(params.doors),
             "corridors_checked": len(params.corridors),
@@ -799,80 +1078,78 @@ async def _check_accessibility(args: dict[str, Any]) -> dict[str, Any]:
 async def _check_egress(args: dict[str, Any]) -> dict[str, Any]:
     """Detailed egress path validation."""
     try:
-        params = CheckEgressParams(**args)
+        params = _CHECK_EGRESS_VALIDATOR.validate_python(args)
     except ValidationError as e:
         return make_error(400, f"Invalid parameters: {e}")
 
-    issues: list[ValidationIssue] = []
+    issues: list[dict[str, Any]] = []
 
     # Get requirements for occupancy type
     reqs = EGRESS_REQUIREMENTS.get(
         params.occupancy_type, EGRESS_REQUIREMENTS["business"]
     )
 
-    # Build door lookup
-    door_map = {d.get("id"): d for d in params.doors}
+    # Build door width lookup
+    door_widths = {d.get("id"): d.get("width", 0) for d in params.doors}
+    max_allowed = params.max_travel_distance or reqs["max_travel"]
+    min_exits = reqs["min_exits"]
+    occupant_factor = reqs["occupant_factor"]
 
+    # One read of each room field; all three checks share them
     for room in params.rooms:
-        rid = room.get("id", "unknown")
-        area = room.get("area", 0)
-        travel_distance = room.get("max_travel_distance", room.get("travel_distance"))
-        exit_door_ids = room.get("exit_door_ids", [])
+        get = room.get
+        rid = get("id", "unknown")
+        area = get("area", 0)
+        travel_distance = get("max_travel_distance")
+        if travel_distance is None:
+            travel_distance = get("travel_distance")
+        exit_door_ids = get("exit_door_ids", [])
+        exit_count = len(exit_door_ids)
 
         # Check travel distance
-        max_allowed = params.max_travel_distance or reqs["max_travel"]
         if travel_distance and travel_distance > max_allowed:
             issues.append(
-                ValidationIssue(
-                    code="EGRESS010",
-                    message=f"Room {rid} travel distance ({travel_distance:.1f}m) exceeds maximum ({max_allowed:.1f}m)",
-                    severity="error",
-                    category="egress",
+                _make_issue(
+                    "EGRESS010",
+                    f"Room {rid} travel distance ({travel_distance:.1f}m) exceeds maximum ({max_allowed:.1f}m)",
                     element_id=rid,
-                    suggested_fix="Add closer exit or reduce room depth",
                 )
             )
 
         # Check exit count
-        if area > 50 and len(exit_door_ids) < reqs["min_exits"]:
+        if area > 50 and exit_count < min_exits:
             issues.append(
-                ValidationIssue(
-                    code="EGRESS011",
-                    message=f"Room {rid} requires {reqs['min_exits']} exits, has {len(exit_door_ids)}",
-                    severity="error",
-                    category="egress",
+                _make_issue(
+                    "EGRESS011",
+                    f"Room {rid} requires {min_exits} exits, has {exit_count}",
                     element_id=rid,
                 )
             )
 
         # Check exit door widths for occupancy
         if area > 0:
-            est_occupancy = area / reqs["occupant_factor"]
+            est_occupancy = area / occupant_factor
             required_width = est_occupancy * 0.0051  # 5.1mm per person (IBC)
 
-            total_width = sum(
-                door_map.get(did, {}).get("width", 0) for did in exit_door_ids
-            )
+            total_width = sum(door_widths.get(did, 0) for did in exit_door_ids)
 
             if total_width > 0 and total_width < required_width:
                 issues.append(
-                    ValidationIssue(
-                        code="EGRESS012",
-                        message=f"Room {rid} exit capacity ({total_width:.2f}m) insufficient for occupancy ({est_occupancy:.0f} persons)",
-                        severity="error",
-                        category="egress",
+                    _make_issue(
+                        "EGRESS012",
+                        f"Room {rid} exit capacity ({total_width:.2f}m) insufficient for occupancy ({est_occupancy:.0f} persons)",
                         element_id=rid,
                     )
                 )
 
-    passed = not any(i.severity == "error" for i in issues)
+    passed = not any(i["severity"] == "error" for i in issues)
 
     return make_response(
         {
             "passed": passed,
             "occupancy_type": params.occupancy_type,
-            "max_travel_distance": params.max_travel_distance or reqs["max_travel"],
-            "issues": [i.to_dict() for i in issues],
+            "max_travel_distance": max_allowed,
+            "issues": issues,
             "issue_count": len(issues),
             "rooms_checked": len(params.rooms),
         },
@@ -883,51 +1160,55 @@ async def _check_egress(args: dict[str, Any]) -> dict[str, Any]:
 async def _check_door_clearances(args: dict[str, Any]) -> dict[str, Any]:
     """Check door swing and maneuvering clearances."""
     try:
-        params = CheckDoorClearancesParams(**args)
+        params = _CHECK_DOOR_CLEARANCES_VALIDATOR.validate_python(args)
     except ValidationError as e:
         return make_error(400, f"Invalid parameters: {e}")
 
-    issues: list[ValidationIssue] = []
+    issues: list[dict[str, Any]] = []
+
+    min_clear_width = params.min_clear_width
+    min_maneuvering = params.min_maneuvering_clearance
 
     for door in params.doors:
         did = door.get("id", "unknown")
         width = door.get("width", 0.9)
         swing = door.get("swing", "push")
         clear_floor_space = door.get("clear_floor_space", float("inf"))
+        too_narrow = width < min_clear_width
+        too_cramped = clear_floor_space < min_maneuvering
+        if not (too_narrow or too_cramped):
+            continue
+        # Both issues share one location lookup
+        pos = get_element_position(door)
 
         # Check clear width
-        if width < params.min_clear_width:
+        if too_narrow:
             issues.append(
-                ValidationIssue(
-                    code="DOOR001",
-                    message=f"Door {did} clear width ({width:.3f}m) below minimum ({params.min_clear_width:.3f}m)",
-                    severity="error",
-                    category="accessibility",
+                _make_issue(
+                    "DOOR001",
+                    f"Door {did} clear width ({width:.3f}m) below minimum ({min_clear_width:.3f}m)",
                     element_id=did,
-                    location=get_element_position(door),
+                    location=pos,
                 )
             )
 
         # Check maneuvering clearance
-        if clear_floor_space < params.min_maneuvering_clearance:
+        if too_cramped:
             issues.append(
-                ValidationIssue(
-                    code="DOOR002",
-                    message=f"Door {did} maneuvering space ({clear_floor_space:.3f}m) below requirement ({params.min_maneuvering_clearance:.3f}m)",
-                    severity="error",
-                    category="accessibility",
+                _make_issue(
+                    "DOOR002",
+                    f"Door {did} maneuvering space ({clear_floor_space:.3f}m) below requirement ({min_maneuvering:.3f}m)",
                     element_id=did,
-                    location=get_element_position(door),
-                    suggested_fix="Increase clear floor space in front of door",
+                    location=pos,
                 )
             )
 
-    passed = not any(i.severity == "error" for i in issues)
+    passed = not any(i["severity"] == "error" for i in issues)
 
     return make_response(
         {
             "passed": passed,
-            "issues": [i.to_dict() for i in issues],
+            "issues": issues,
             "issue_count": len(issues),
             "doors_checked": len(params.doors),
         },
@@ -938,14 +1219,26 @@ async def _check_door_clearances(args: dict[str, Any]) -> dict[str, Any]:
 async def _check_stair_compliance(args: dict[str, Any]) -> dict[str, Any]:
     """Check stair dimension compliance."""
     try:
-        params = CheckStairComplianceParams(**args)
+        params = _CHECK_STAIR_COMPLIANCE_VALIDATOR.validate_python(args)
     except ValidationError as e:
         return make_error(400, f"Invalid parameters: {e}")
 
-    issues: list[ValidationIssue] = []
+    issues: list[dict[str, Any]] = []
 
     # Get code requirements
     reqs = STAIR_REQUIREMENTS_IBC  # Default to IBC
+    min_width = reqs["min_width"]
+    max_riser = reqs["max_riser_height"]
+    min_riser = reqs["min_riser_height"]
+    min_tread = reqs["min_tread_depth"]
+    min_headroom = reqs["min_headroom"]
+    # Threshold text is the same in every message, so format it once per call
+    building_code = params.building_code
+    min_width_str = f"{min_width:.3f}m"
+    max_riser_str = f"{max_riser:.3f}m"
+    min_riser_str = f"{min_riser:.3f}m"
+    min_tread_str = f"{min_tread:.3f}m"
+    min_headroom_str = f"{min_headroom:.3f}m"
 
     for stair in params.stairs:
         sid = stair.get("id", "unknown")
@@ -955,70 +1248,60 @@ async def _check_stair_compliance(args: dict[str, Any]) -> dict[str, Any]:
         headroom = stair.get("headroom", 2.1)
 
         # Check width
-        if width < reqs["min_width"]:
+        if width < min_width:
             issues.append(
-                ValidationIssue(
-                    code="STAIR001",
-                    message=f"Stair {sid} width ({width:.3f}m) below {params.building_code} minimum ({reqs['min_width']:.3f}m)",
-                    severity="error",
-                    category="egress",
+                _make_issue(
+                    "STAIR001",
+                    f"Stair {sid} width ({width:.3f}m) below {building_code} minimum ({min_width_str})",
                     element_id=sid,
                 )
             )
 
         # Check riser height
-        if riser_height > reqs["max_riser_height"]:
+        if riser_height > max_riser:
             issues.append(
-                ValidationIssue(
-                    code="STAIR002",
-                    message=f"Stair {sid} riser ({riser_height:.3f}m) exceeds maximum ({reqs['max_riser_height']:.3f}m)",
-                    severity="error",
-                    category="egress",
+                _make_issue(
+                    "STAIR002",
+                    f"Stair {sid} riser ({riser_height:.3f}m) exceeds maximum ({max_riser_str})",
                     element_id=sid,
                 )
             )
-        elif riser_height < reqs["min_riser_height"]:
+        elif riser_height < min_riser:
             issues.append(
-                ValidationIssue(
-                    code="STAIR003",
-                    message=f"Stair {sid} riser ({riser_height:.3f}m) below minimum ({reqs['min_riser_height']:.3f}m)",
-                    severity="error",
-                    category="egress",
+                _make_issue(
+                    "STAIR003",
+                    f"Stair {sid} riser ({riser_height:.3f}m) below minimum ({min_riser_str})",
                     element_id=sid,
                 )
             )
 
         # Check tread depth
-        if tread_depth < reqs["min_tread_depth"]:
+        if tread_depth < min_tread:
             issues.append(
-                ValidationIssue(
-                    code="STAIR004",
-                    message=f"Stair {sid} tread ({tread_depth:.3f}m) below minimum ({reqs['min_tread_depth']:.3f}m)",
-                    severity="error",
-                    category="egress",
+                _make_issue(
+                    "STAIR004",
+                    f"Stair {sid} tread ({tread_depth:.3f}m) below minimum ({min_tread_str})",
                     element_id=sid,
                 )
             )
 
         # Check headroom
-        if headroom < reqs["min_headroom"]:
+        if headroom < min_headroom:
             issues.append(
-                ValidationIssue(
-                    code="STAIR005",
-                    message=f"Stair {sid} headroom ({headroom:.3f}m) below minimum ({reqs['min_headroom']:.3f}m)",
-                    severity="error",
-                    category="egress",
+                _make_issue(
+                    "STAIR005",
+                    f"Stair {sid} headroom ({headroom:.3f}m) below minimum ({min_headroom_str})",
                     element_id=sid,
                 )
             )
 
-    passed = not any(i.severity == "error" for i in issues)
+    passed = not any(i["severity"] == "error" for i in issues)
 
     return make_response(
         {
             "passed": passed,
             "building_code": params.building_code,
-            "issues": [i.to_dict() for i in issues],
+            "issues": issues,
             "issue_count": len(issues),
             "stairs_checked": len(params.stairs),
         },
@@ -1042,40 +1325,96 @@ def get_element_bbox(element: dict[str, Any]) -> dict[str, list[float]] | None:
         if "min" in bbox and "max" in bbox:
             return bbox
 
+    box = _element_box(element)
+    if box is None:
+        return None
+    return {"min": list(box[:3]), "max": list(box[3:])}
+
+
+def _element_box(
+    element: dict[str, Any],
+) -> tuple[float, float, float, float, float, float] | None:
+    """Compute an element's bounding box as a flat (min_xyz, max_xyz) tuple.
+
+    Same rules as ``get_element_bbox``, without building the intermediate
+    {'min', 'max'} dict.
+    """
+    # Direct bbox
+    if "bbox" in element:
+        bbox = element["bbox"]
+        if "min" in bbox and "max" in bbox:
+            lo = bbox["min"]
+            hi = bbox["max"]
+            return (lo[0], lo[1], lo[2], hi[0], hi[1], hi[2])
+
     # Wall element (line with thickness)
     if "start" in element and "end" in element:
         start = element["start"]
         end = element["end"]
         thickness = element.get("thickness", 0.2) / 2
-        height = element.get("height", 2.7)
-
-        min_x = min(start[0], end[0]) - thickness
-        max_x = max(start[0], end[0]) + thickness
-        min_y = min(start[1], end[1]) - thickness
-        max_y = max(start[1], end[1]) + thickness
         min_z = element.get("base_level", 0)
-        max_z = min_z + height
 
-        return {
-            "min": [min_x, min_y, min_z],
-            "max": [max_x, max_y, max_z],
-        }
+        return (
+            min(start[0], end[0]) - thickness,
+            min(start[1], end[1]) - thickness,
+            min_z,
+            max(start[0], end[0]) + thickness,
+            max(start[1], end[1]) + thickness,
+            min_z + element.get("height", 2.7),
+        )
 
     # Position-based element (door, window, etc.)
     if "position" in element:
         pos = element["position"]
         width = element.get("width", 0.9) / 2
-        height = element.get("height", 2.1)
         depth = element.get("depth", 0.1) / 2
-
-        return {
-            "min": [pos[0] - width, pos[1] - depth, pos[2] if len(pos) > 2 else 0],
-            "max": [pos[0] + width, pos[1] + depth, (pos[2] if len(pos) > 2 else 0) + height],
-        }
+        base_z = pos[2] if len(pos) > 2 else 0
+
+        return (
+            pos[0] - width,
+            pos[1] - depth,
+            base_z,
+            pos[0] + width,
+            pos[1] + depth,
+            base_z + element.get("height", 2.1),
+        )
 
     return None
 
 
+def _resolve_boxes(
+    elements: Iterable[dict[str, Any]],
+) -> tuple[list[dict[str, Any]], list[tuple[float, float, float, float, float, float]]]:
+    """Resolve element boxes in one pass.
+
+    Returns parallel lists of the elements that have a bounding box and their
+    flat boxes, so the pair loops can index both by position.
+    """
+    valid: list[dict[str, Any]] = []
+    boxes: list[tuple[float, float, float, float, float, float]] = []
+    element_box = _element_box
+
+    for element in elements:
+        box = element_box(element)
+        if box is not None:
+            valid.append(element)
+            boxes.append(box)
+
+    return valid, boxes
+
+
+# Clash class indexed by how many thresholds the minimum axis overlap clears:
+# -clearance (within clearance), 0 (touching) and tolerance (penetrating)
+_CLASH_SEVERITIES = ("none", "clearance", "soft", "hard")
+
+# Rank of each clash type for severity_threshold filtering, and the issue
+# severity reported for it when no custom severity_levels entry applies
+_CLASH_TYPE_ORDER = MappingProxyType({"clearance": 0, "soft": 1, "hard": 2})
+_CLASH_SEVERITY_MAP = MappingProxyType(
+    {"hard": "error", "soft": "warning", "clearance": "info"}
+)
+
+
 def bboxes_intersect(
     bbox_a: dict[str, list[float]],
     bbox_b: dict[str, list[float]],
@@ -1088,34 +1427,197 @@ def bboxes_intersect(
         (intersects, severity, penetration_depth)
         - severity: 'hard' (penetrating), 'soft' (touching), 'clearance' (within clearance)
     """
-    # Expand bbox_b by tolerance
     a_min = bbox_a["min"]
     a_max = bbox_a["max"]
-    b_min = [b - tolerance for b in bbox_b["min"]]
-    b_max = [b + tolerance for b in bbox_b["max"]]
-
-    # Check for no intersection (gap in any axis)
-    for i in range(3):
-        if a_max[i] < b_min[i] or a_min[i] > b_max[i]:
-            # Check clearance
-            gap = max(b_min[i] - a_max[i], a_min[i] - b_max[i])
-            if gap > 0 and gap <= clearance:
-                return True, "clearance", gap
-            return False, "none", 0.0
-
-    # Boxes intersect - calculate penetration depth
-    overlaps = []
-    for i in range(3):
-        overlap = min(a_max[i], b_max[i]) - max(a_min[i], b_min[i])
-        overlaps.append(overlap)
-
-    penetration = min(overlaps)
-
-    # Determine severity
-    if penetration > tolerance:
-        return True, "hard", penetration
+    b_min = bbox_b["min"]
+    b_max = bbox_b["max"]
+
+    # Signed overlap per axis against bbox_b expanded by tolerance; a negative
+    # value is the gap along a separating axis
+    min_overlap = min(
+        min(a_max[0], b_max[0] + tolerance) - max(a_min[0], b_min[0] - tolerance),
+        min(a_max[1], b_max[1] + tolerance) - max(a_min[1], b_min[1] - tolerance),
+        min(a_max[2], b_max[2] + tolerance) - max(a_min[2], b_min[2] - tolerance),
+    )
+
+    code = (min_overlap >= -clearance) + (min_overlap >= 0) + (min_overlap > tolerance)
+    return code > 0, _CLASH_SEVERITIES[code], abs(min_overlap) if code else 0.0
+
+
+def _overlap_pairs(
+    boxes: list[tuple[float, float, float, float, float, float]],
+    pairs: Iterable[tuple[int, int]],
+    tolerance: float,
+    clearance: float,
+    min_code: int = 1,
+) -> list[tuple[int, int, int, float]]:
+    """Narrow-phase AABB test over candidate index pairs.
+
+    ``boxes`` holds flat (min_x, min_y, min_z, max_x, max_y, max_z) tuples.
+    This is ``bboxes_intersect`` inlined over a whole batch of pairs, so the
+    hot loop does no dict lookups or per-pair function calls. Pairs whose
+    code is below ``min_code`` are dropped here rather than by the caller.
+
+    Returns:
+        (i, j, code, depth) for each intersecting pair, where ``code`` indexes
+        ``_CLASH_SEVERITIES`` and ``depth`` is the penetration or gap.
+    """
+    hits: list[tuple[int, int, int, float]] = []
+    append = hits.append
+
+    for i, j in pairs:
+        ax0, ay0, az0, ax1, ay1, az1 = boxes[i]
+        bx0, by0, bz0, bx1, by1, bz1 = boxes[j]
+
+        min_overlap = min(
+            min(ax1, bx1 + tolerance) - max(ax0, bx0 - tolerance),
+            min(ay1, by1 + tolerance) - max(ay0, by0 - tolerance),
+            min(az1, bz1 + tolerance) - max(az0, bz0 - tolerance),
+        )
+        if min_overlap < -clearance:
+            continue
+
+        code = 1 + (min_overlap >= 0) + (min_overlap > tolerance)
+        if code >= min_code:
+            append((i, j, code, abs(min_overlap)))
+
+    return hits
+
+
+# Below this many boxes the plain all-pairs loop beats sorting for a sweep
+_BROAD_PHASE_THRESHOLD = 64
+
+
+def _sweep_axis(
+    boxes: list[tuple[float, float, float, float, float, float]],
+) -> int:
+    """Axis (0=X, 1=Y, 2=Z) that keeps the sweep's active list shortest.
+
+    The active list grows with how long boxes are along the axis relative to
+    how far apart they are spread, so pick the axis with the smallest total
+    extent per unit of span: Z for a tower whose floors share a footprint, Y
+    for a plan of walls running along X.
+    """
+    best_axis = 0
+    best_cost = math.inf
+    for axis in range(3):
+        lows = [box[axis] for box in boxes]
+        span = max(lows) - min(lows)
+        if span <= 0:
+            continue
+        extent = sum(box[axis + 3] for box in boxes) - sum(lows)
+        cost = extent / span
+        if cost < best_cost:
+            best_axis = axis
+            best_cost = cost
+    return best_axis
+
+
+def _sweep_pairs(
+    boxes: list[tuple[float, float, float, float, float, float]],
+    margin: float,
+) -> list[tuple[int, int]]:
+    """Sweep-and-prune broad phase along the axis picked by ``_sweep_axis``.
+
+    Returns every (i, j) pair with i < j whose intervals on that axis,
+    widened by ``margin``, overlap. This is a superset of the pairs
+    ``_overlap_pairs`` can report when ``margin`` is tolerance + clearance.
+    Pairs are sorted to match ``combinations`` order, so results come out in
+    the same order as the all-pairs loop.
+    """
+    if not boxes:
+        return []
+    lo = _sweep_axis(boxes)
+    hi = lo + 3
+    order = sorted(range(len(boxes)), key=lambda k: boxes[k][lo])
+    active: list[tuple[float, int]] = []
+    pairs: list[tuple[int, int]] = []
+
+    for k in order:
+        start = boxes[k][lo]
+        # Boxes ending (with margin) before this one starts can't reach any
+        # later box either, since the sweep visits boxes by increasing min
+        active = [entry for entry in active if entry[0] >= start]
+        for _, other in active:
+            pairs.append((other, k) if other < k else (k, other))
+        active.append((boxes[k][hi] + margin, k))
+
+    pairs.sort()
+    return pairs
+
+
+def _sweep_cross_pairs(
+    boxes: list[tuple[float, float, float, float, float, float]],
+    split: int,
+    margin: float,
+) -> list[tuple[int, int]]:
+    """Sweep-and-prune broad phase between two sets sharing one box list.
+
+    Boxes before ``split`` form the first set and the rest the second. Like
+    ``_sweep_pairs``, but each set keeps its own active list and a box is
+    only paired with the other set's, so same-set overlaps are never
+    generated. Returns (i, j) pairs with i < split <= j, sorted.
+    """
+    if not boxes:
+        return []
+    lo = _sweep_axis(boxes)
+    hi = lo + 3
+    order = sorted(range(len(boxes)), key=lambda k: boxes[k][lo])
+    active_a: list[tuple[float, int]] = []
+    active_b: list[tuple[float, int]] = []
+    pairs: list[tuple[int, int]] = []
+
+    for k in order:
+        start = boxes[k][lo]
+        entry = (boxes[k][hi] + margin, k)
+        if k < split:
+            active_b = [e for e in active_b if e[0] >= start]
+            pairs.extend((k, other) for _, other in active_b)
+            active_a.append(entry)
+        else:
+            active_a = [e for e in active_a if e[0] >= start]
+            pairs.extend((other, k) for _, other in active_a)
+            active_b.append(entry)
+
+    pairs.sort()
+    return pairs
+
+
+def _cross_set_hits(
+    boxes: list[tuple[float, float, float, float, float, float]],
+    split: int,
+    tolerance: float,
+    clearance: float,
+) -> list[tuple[int, int, int, float]]:
+    """Broad and narrow phase between the sets on either side of ``split``."""
+    if len(boxes) < _BROAD_PHASE_THRESHOLD:
+        pairs: Iterable[tuple[int, int]] = (
+            (i, j) for i in range(split) for j in range(split, len(boxes))
+        )
     else:
-        return True, "soft", penetration
+        pairs = _sweep_cross_pairs(boxes, split, tolerance + clearance)
+    return _overlap_pairs(boxes, pairs, tolerance, clearance)
+
+
+def _candidate_pairs(
+    boxes: list[tuple[float, float, float, float, float, float]],
+    margin: float,
+) -> Iterable[tuple[int, int]]:
+    """All (i, j) pairs with i < j, pruned by a sweep for larger inputs."""
+    if len(boxes) < _BROAD_PHASE_THRESHOLD:
+        return combinations(range(len(boxes)), 2)
+    return _sweep_pairs(boxes, margin)
+
+
+def _overlap_center(box_a: tuple[float, ...], box_b: tuple[float, ...]) -> list[float]:
+    """Center of the overlap region of two flat boxes, rounded for output."""
+    ax0, ay0, az0, ax1, ay1, az1 = box_a
+    bx0, by0, bz0, bx1, by1, bz1 = box_b
+    return [
+        round((max(ax0, bx0) + min(ax1, bx1)) / 2, 4),
+        round((max(ay0, by0) + min(ay1, by1)) / 2, 4),
+        round((max(az0, bz0) + min(az1, bz1)) / 2, 4),
+    ]
 
 
 class ClashResult:
@@ -1132,7 +1634,7 @@ class ClashResult:
         penetration_depth: float,
         location: list[float] | None = None,
     ):
-        self.id = str(uuid4())
+        self.id = f"{_ISSUE_ID_PREFIX}-{next(_issue_counter)}"
         self.element_a_id = element_a_id
         self.element_b_id = element_b_id
         self.element_a_type = element_a_type
@@ -1157,6 +1659,42 @@ class ClashResult:
         }
 
 
+def _clash_label(element: dict[str, Any], index: int) -> tuple[Any, Any, str]:
+    """(id, type, lowercased type) reported for an element in detect_clashes."""
+    etype = element.get("type", element.get("element_type", "unknown"))
+    return element.get("id", f"element_{index}"), etype, str(etype).lower()
+
+
+def _make_clash(
+    element_a_id: str,
+    element_b_id: str,
+    element_a_type: str,
+    element_b_type: str,
+    clash_type: str,
+    severity: str,
+    penetration_depth: float,
+    location: list[float] | None = None,
+) -> dict[str, Any]:
+    """Build a clash dict with the same shape as ``ClashResult.to_dict()``.
+
+    The clash tools put these straight into the response, so no
+    ``ClashResult`` is constructed per hit.
+    """
+    depth = round(penetration_depth, 4)
+    return {
+        "id": f"{_ISSUE_ID_PREFIX}-{next(_issue_counter)}",
+        "element_a_id": element_a_id,
+        "element_b_id": element_b_id,
+        "element_a_type": element_a_type,
+        "element_b_type": element_b_type,
+        "clash_type": clash_type,
+        "severity": severity,
+        "overlap_distance": depth,
+        "penetration_depth": depth,
+        "location": location,
+    }
+
+
 async def _detect_clashes(args: dict[str, Any]) -> dict[str, Any]:
     """Detect clashes between elements.
 
@@ -1164,7 +1702,7 @@ async def _detect_clashes(args: dict[str, Any]) -> dict[str, Any]:
     with configurable tolerance and severity thresholds.
     """
     try:
-        params = DetectClashesParams(**args)
+        params = _DETECT_CLASHES_VALIDATOR.validate_python(args)
     except ValidationError as e:
         return make_error(400, f"Invalid parameters: {e}")
 
@@ -1178,71 +1716,64 @@ async def _detect_clashes(args: dict[str, Any]) -> dict[str, Any]:
             }
         ]
 
-    # Build bounding box cache
-    bbox_cache: dict[str, dict[str, list[float]]] = {}
-    valid_elements: list[dict[str, Any]] = []
-    skipped_no_bbox = 0
-
-    for element in elements:
-        eid = element.get("id", str(uuid4()))
-        bbox = get_element_bbox(element)
-        if bbox:
-            bbox_cache[eid] = bbox
-            valid_elements.append(element)
-        else:
-            skipped_no_bbox += 1
+    # Resolve each bbox once; the pair loop indexes these lists by position so
+    # elements with missing or duplicate IDs still get their own bbox
+    valid_elements, boxes = _resolve_boxes(elements)
+    skipped_no_bbox = len(elements) - len(valid_elements)
 
-    # Severity order for filtering (by clash type)
-    severity_order = {"clearance": 0, "soft": 1, "hard": 2}
-    threshold = severity_order.get(params.severity_threshold, 1)
+    # Severity order for filtering (by clash type); clash codes sit one above
+    # their rank, so the filter is applied inside the pair loop
+    threshold = _CLASH_TYPE_ORDER.get(params.severity_threshold, 1)
     severity_levels = params.severity_levels or {}
-    severity_map = {"hard": "error", "soft": "warning", "clearance": "info"}
+    severity_map = _CLASH_SEVERITY_MAP
 
     # Check all pairs
-    clashes: list[ClashResult] = []
+    clashes: list[dict[str, Any]] = []
     counts_by_clash_type = {"hard": 0, "soft": 0, "clearance": 0}
     counts_by_severity = {"error": 0, "warning": 0, "info": 0}
     counts_by_type: dict[str, int] = {}
     n = len(valid_elements)
 
-    for i in range(n):
-        elem_a = valid_elements[i]
-        aid = elem_a.get("id", f"element_{i}")
-        atype = elem_a.get("type", elem_a.get("element_type", "unknown"))
-        atype_norm = str(atype).lower()
-        bbox_a = bbox_cache[aid]
-
-        for j in range(i + 1, n):
-            elem_b = valid_elements[j]
-            bid = elem_b.get("id", f"element_{j}")
-            btype = elem_b.get("type", elem_b.get("element_type", "unknown"))
-            btype_norm = str(btype).lower()
-            bbox_b = bbox_cache[bid]
-
-            # Check intersection
-            intersects, clash_type, penetration = bboxes_intersect(
-                bbox_a,
-                bbox_b,
-                tolerance=params.tolerance,
-                clearance=params.clearance_distance,
-            )
-
-            if intersects and severity_order.get(clash_type, 0) >= threshold:
-                pair_key = f"{atype_norm}-{btype_norm}"
-                reverse_key = f"{btype_norm}-{atype_norm}"
-                severity_level = severity_levels.get(pair_key) or severity_levels.get(reverse_key)
-                if not severity_level:
-                    severity_level = severity_map.get(clash_type, "warning")
-
-                # Calculate clash location (center of overlap region)
-                loc_x = (max(bbox_a["min"][0], bbox_b["min"][0]) +
-                        min(bbox_a["max"][0], bbox_b["max"][0])) / 2
-                loc_y = (max(bbox_a["min"][1], bbox_b["min"][1]) +
-                        min(bbox_a["max"][1], bbox_b["max"][1])) / 2
-                loc_z = (max(bbox_a["min"][2], bbox_b["min"][2]) +
-                        min(bbox_a["max"][2], bbox_b["max"][2])) / 2
-
-                clashes.append(ClashResult(
+    # Clearance only decides clearance-class clashes; when those are filtered
+    # out it would just widen the sweep and admit pairs that get dropped
+    clearance = params.clearance_distance if threshold == 0 else 0.0
+    hits = _overlap_pairs(
+        boxes,
+        _candidate_pairs(boxes, params.tolerance + clearance),
+        params.tolerance,
+        clearance,
+        threshold + 1,
+    )
+    # Clashes past the limit are still counted but never built
+    max_listed = len(hits) if params.limit is None else params.limit
+
+    # An element usually appears in several clashes; read its id and type once
+    labels: dict[int, tuple[Any, Any, str]] = {}
+
+    for i, j, code, penetration in hits:
+        clash_type = _CLASH_SEVERITIES[code]
+
+        label_a = labels.get(i)
+        if label_a is None:
+            label_a = labels[i] = _clash_label(valid_elements[i], i)
+        aid, atype, atype_norm = label_a
+
+        label_b = labels.get(j)
+        if label_b is None:
+            label_b = labels[j] = _clash_label(valid_elements[j], j)
+        bid, btype, btype_norm = label_b
+
+        severity_level = None
+        if severity_levels:
+            severity_level = severity_levels.get(
+                f"{atype_norm}-{btype_norm}"
+            ) or severity_levels.get(f"{btype_norm}-{atype_norm}")
+        if not severity_level:
+            severity_level = severity_map.get(clash_type, "warning")
+
+        if len(clashes) < max_listed:
+            clashes.append(
+                _make_clash(
                     element_a_id=aid,
                     element_b_id=bid,
                     element_a_type=atype,
@@ -1250,19 +1781,26 @@ async def _detect_clashes(args: dict[str, Any]) -> dict[str, Any]:
                     clash_type=clash_type,
                     severity=severity_level,
                     penetration_depth=penetration,
-                    location=[round(loc_x, 4), round(loc_y, 4), round(loc_z, 4)],
-                ))
+                    location=_overlap_center(boxes[i], boxes[j]),
+                )
+            )
 
-                counts_by_clash_type[clash_type] = counts_by_clash_type.get(clash_type, 0) + 1
-                counts_by_severity[severity_level] = counts_by_severity.get(severity_level, 0) + 1
-                normalized_pair = "-".join(sorted([atype_norm, btype_norm]))
-                counts_by_type[normalized_pair] = counts_by_type.get(normalized_pair, 0) + 1
+        counts_by_clash_type[clash_type] = counts_by_clash_type.get(clash_type, 0) + 1
+        counts_by_severity[severity_level] = (
+            counts_by_severity.get(severity_level, 0) + 1
+        )
+        if atype_norm <= btype_norm:
+            normalized_pair = f"{atype_norm}-{btype_norm}"
+        else:
+            normalized_pair = f"{btype_norm}-{atype_norm}"
+        counts_by_type[normalized_pair] = counts_by_type.get(normalized_pair, 0) + 1
 
     return make_response(
         {
-            "clashes": [c.to_dict() for c in clashes],
-            "clash_count": len(clashes),
-            "clash_free": len(clashes) == 0,
+            "clashes": clashes,
+            "clash_count": len(hits),
+            "clash_free": not hits,
+            "clashes_truncated": len(clashes) < len(hits),
             "counts": counts_by_clash_type,
             "counts_by_severity": counts_by_severity,
             "counts_by_type": counts_by_type,
@@ -1283,86 +1821,71 @@ async def _detect_clashes_between_sets(args: dict[str, Any]) -> dict[str, Any]:
     e.g., structural vs architectural elements.
     """
     try:
-        params = DetectClashesBetweenSetsParams(**args)
+        params = _DETECT_CLASHES_BETWEEN_SETS_VALIDATOR.validate_python(args)
     except ValidationError as e:
         return make_error(400, f"Invalid parameters: {e}")
 
-    # Build bounding box caches
-    bbox_cache_a: dict[str, dict[str, list[float]]] = {}
-    bbox_cache_b: dict[str, dict[str, list[float]]] = {}
-
-    valid_a: list[dict[str, Any]] = []
-    valid_b: list[dict[str, Any]] = []
-
-    for element in params.set_a:
-        eid = element.get("id", str(uuid4()))
-        bbox = get_element_bbox(element)
-        if bbox:
-            bbox_cache_a[eid] = bbox
-            valid_a.append(element)
-
-    for element in params.set_b:
-        eid = element.get("id", str(uuid4()))
-        bbox = get_element_bbox(element)
-        if bbox:
-            bbox_cache_b[eid] = bbox
-            valid_b.append(element)
+    # Resolve each bbox once per set
+    valid_a, boxes_a = _resolve_boxes(params.set_a)
+    valid_b, boxes_b = _resolve_boxes(params.set_b)
 
     # Check all pairs between sets
-    clashes: list[ClashResult] = []
+    clashes: list[dict[str, Any]] = []
     counts_by_clash_type = {"hard": 0, "soft": 0, "clearance": 0}
     counts_by_severity = {"error": 0, "warning": 0, "info": 0}
     counts_by_type: dict[str, int] = {}
-    severity_map = {"hard": "error", "soft": "warning", "clearance": "info"}
+    severity_map = _CLASH_SEVERITY_MAP
+
+    # Both sets share one box list: set_a at [0, na), set_b at [na, na + nb)
+    na = len(valid_a)
+    nb = len(valid_b)
+    boxes = boxes_a + boxes_b
+
+    # Large sets are checked on a worker thread, as in validate_model
+    if na + nb >= _OFFLOAD_THRESHOLD:
+        hits = await asyncio.to_thread(
+            _cross_set_hits, boxes, na, params.tolerance, params.clearance_distance
+        )
+    else:
+        hits = _cross_set_hits(boxes, na, params.tolerance, params.clearance_distance)
 
-    for elem_a in valid_a:
+    for i, j, code, penetration in hits:
+        clash_type = _CLASH_SEVERITIES[code]
+        severity_level = severity_map.get(clash_type, "warning")
+
+        elem_a = valid_a[i]
         aid = elem_a.get("id")
         atype = elem_a.get("type", elem_a.get("element_type", "unknown"))
         atype_norm = str(atype).lower()
-        bbox_a = bbox_cache_a[aid]
-
-        for elem_b in valid_b:
-            bid = elem_b.get("id")
-            btype = elem_b.get("type", elem_b.get("element_type", "unknown"))
-            btype_norm = str(btype).lower()
-            bbox_b = bbox_cache_b[bid]
-
-            intersects, clash_type, penetration = bboxes_intersect(
-                bbox_a,
-                bbox_b,
-                tolerance=params.tolerance,
-                clearance=params.clearance_distance,
-            )
 
-            if intersects:
-                severity_level = severity_map.get(clash_type, "warning")
-                # Calculate clash location
-                loc_x = (max(bbox_a["min"][0], bbox_b["min"][0]) +
-                        min(bbox_a["max"][0], bbox_b["max"][0])) / 2
-                loc_y = (max(bbox_a["min"][1], bbox_b["min"][1]) +
-                        min(bbox_a["max"][1], bbox_b["max"][1])) / 2
-                loc_z = (max(bbox_a["min"][2], bbox_b["min"][2]) +
-                        min(bbox_a["max"][2], bbox_b["max"][2])) / 2
-
-                clashes.append(ClashResult(
-                    element_a_id=aid,
-                    element_b_id=bid,
-                    element_a_type=atype,
-                    element_b_type=btype,
-                    clash_type=clash_type,
-                    severity=severity_level,
-                    penetration_depth=penetration,
-                    location=[round(loc_x, 4), round(loc_y, 4), round(loc_z, 4)],
-                ))
+        elem_b = valid_b[j - na]
+        bid = elem_b.get("id")
+        btype = elem_b.get("type", elem_b.get("element_type", "unknown"))
+        btype_norm = str(btype).lower()
+
+        clashes.append(
+            _make_clash(
+                element_a_id=aid,
+                element_b_id=bid,
+                element_a_type=atype,
+                element_b_type=btype,
+                clash_type=clash_type,
+                severity=severity_level,
+                penetration_depth=penetration,
+                location=_overlap_center(boxes[i], boxes[j]),
+            )
+        )
 
-                counts_by_clash_type[clash_type] = counts_by_clash_type.get(clash_type, 0) + 1
-                counts_by_severity[severity_level] = counts_by_severity.get(severity_level, 0) + 1
-                normalized_pair = "-".join(sorted([atype_norm, btype_norm]))
-                counts_by_type[normalized_pair] = counts_by_type.get(normalized_pair, 0) + 1
+        counts_by_clash_type[clash_type] = counts_by_clash_type.get(clash_type, 0) + 1
+        counts_by_severity[severity_level] = (
+            counts_by_severity.get(severity_level, 0) + 1
+        )
+        normalized_pair = "-".join(sorted([atype_norm, btype_norm]))
+        counts_by_type[normalized_pair] = counts_by_type.get(normalized_pair, 0) + 1
 
     return make_response(
         {
-            "clashes": [c.to_dict() for c in clashes],
+            "clashes": clashes,
             "clash_count": len(clashes),
             "clash_free": len(clashes) == 0,
             "counts": counts_by_clash_type,
@@ -1604,8 +2127,14 @@ TOOLS = [
                 },
                 "clearance_distance": {
                     "type": "number",
+                    "minimum": 0,
                     "description": "Clearance distance for soft clash detection (meters)",
                 },
+                "limit": {
+                    "type": "integer",
+                    "minimum": 0,
+                    "description": "Maximum clashes to list (default: all); counts cover every clash",
+                },
                 "reasoning": {"type": "string"},
             },
             "required": ["elements"],
@@ -1634,6 +2163,7 @@ TOOLS = [
                 },
                 "clearance_distance": {
                     "type": "number",
+                    "minimum": 0,
                     "description": "Clearance distance for soft clash detection",
                 },
                 "reasoning": {"type": "string"},
@@ -1643,6 +2173,22 @@ TOOLS = [
     ),
 ]
 
+# Tool name -> implementation, so call_tool dispatches with one lookup
+TOOL_HANDLERS: MappingProxyType[
+    str, Callable[[dict[str, Any]], Awaitable[dict[str, Any]]]
+] = MappingProxyType(
+    {
+        "validate_model": _validate_model,
+        "check_fire_compliance": _check_fire_compliance,
+        "check_accessibility": _check_accessibility,
+        "check_egress": _check_egress,
+        "check_door_clearances": _check_door_clearances,
+        "check_stair_compliance": _check_stair_compliance,
+        "detect_clashes": _detect_clashes,
+        "detect_clashes_between_sets": _detect_clashes_between_sets,
+    }
+)
+
 
 # =============================================================================
 # Server Setup
@@ -1662,33 +2208,20 @@ def create_server() -> Server:
         logger.info(f"Tool called: {name}")
 
         try:
-            if name == "validate_model":
-                result = await _validate_model(arguments)
-            elif name == "check_fire_compliance":
-                result = await _check_fire_compliance(arguments)
-            elif name == "check_accessibility":
-                result = await _check_accessibility(arguments)
-            elif name == "check_egress":
-                result = await _check_egress(arguments)
-            elif name == "check_door_clearances":
-                result = await _check_door_clearances(arguments)
-            elif name == "check_stair_compliance":
-                result = await _check_stair_compliance(arguments)
-            elif name == "detect_clashes":
-                result = await _detect_clashes(arguments)
-            elif name == "detect_clashes_between_sets":
-                result = await _detect_clashes_between_sets(arguments)
-            else:
+            handler = TOOL_HANDLERS.get(name)
+            if handler is None:
                 result = make_error(404, f"Unknown tool: {name}")
+            else:
+                result = await handler(arguments)
 
-            return [TextContent(type="text", text=json.dumps(result, indent=2))]
+            return [TextContent(type="text", text=dump_json(result, indent=True))]
 
         except Exception as e:
             logger.exception(f"Error in tool {name}")
             return [
                 TextContent(
                     type="text",
-                    text=json.dumps(make_error(500, str(e))),
+                    text=dump_json(make_error(500, str(e))),
                 )
             ]
 